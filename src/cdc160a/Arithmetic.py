@@ -44,8 +44,8 @@ def subtract(minuend: int, subtrahend: int) -> int:
              arithmetic
     """
     difference = (minuend & 0o7777) - (subtrahend & 0o7777)
-    borrow = difference & ~0o7777
-    if borrow != 0:
+    # Both operands are 12-bit, so a borrow leaves the difference negative.
+    if difference < 0:
         difference -= 1
     return difference & 0o7777
 
@@ -59,7 +59,11 @@ def add(lhs: int, rhs: int) -> int:
     :return: the sum, as described above, also a 12-bit signed
              integer
     """
-    return subtract(lhs, negate(rhs))
+    # subtract(lhs, negate(rhs)), inlined since add is on every ADx path.
+    difference = (lhs & 0o7777) - ((rhs & 0o7777) ^ 0o7777)
+    if difference < 0:
+        difference -= 1
+    return difference & 0o7777
 
 def times_ten(multiplier: int) -> int:
     """
@@ -28,6 +28,11 @@ class Hardware:
     """
     Holds all hardware components so we can pass them around easily.
     """
+
+    # The hardware complement is fixed, so, like Storage, Hardware keeps
+    # its components in slots.
+    __slots__ = ("input_output", "storage")
+
     def __init__(self, input_output: InputOutput, storage: Storage):
         """
         Constructor
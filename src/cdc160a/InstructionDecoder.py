@@ -50,6 +50,10 @@ Instructions are decoded as follows:
    a decode method having the following signature:
 
    def decode(e: int) -> Instruction
+
+The module-level decode(f, e) function runs every (F, E) pair through
+these steps once, at import, and thereafter returns the instruction from
+a table indexed by the 12-bit instruction word.
 """
 from abc import ABCMeta, abstractmethod
 import Instructions
@@ -290,9 +294,28 @@ __DECODERS = [
     OpCode77(),                                                 # 77
 ]
 
+# Every instruction word decoded once, at import, and indexed by the
+# 12-bit word (F << 6) | E, so that decode() is a single lookup.
+__INSTRUCTIONS = tuple(
+    __DECODERS[word >> 6].decode(word & 0o77) for word in range(0o10000))
+
+
 def decoder_at(e: int):
     return __DECODERS[e]
 
 
 def decode(f: int, e: int) -> BaseInstruction:
-    return __DECODERS[f].decode(e)
+    return __INSTRUCTIONS[((f & 0o77) << 6) | (e & 0o77)]
+
+
+def decode_word(word: int) -> BaseInstruction:
+    """
+    Decode an entire 12-bit instruction word, sparing callers that
+    hold the word, Z after unpack_instruction() for example, the work
+    of splitting it into F and E and putting it back together.
+
+    :param word: instruction word; only the low-order 12 bits are
+           decoded
+    :return: the instruction that the word represents
+    """
+    return __INSTRUCTIONS[word & 0o7777]
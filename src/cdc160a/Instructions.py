@@ -122,6 +122,19 @@ class BaseInstruction(metaclass=ABCMeta):
         """
         pass
 
+    def execute(self, hardware: Hardware) -> int:
+        """
+        Determine the effective address and then perform the logic. Use
+        this where nothing needs to run between the two phases; the run
+        loop calls them separately so the console can display the
+        effective address.
+
+        :param hardware: the 160-A hardware: Storage, I/O, etc.
+        :return: instruction execution time in cycles
+        """
+        self.determine_effective_address(hardware.storage)
+        return self.perform_logic(hardware)
+
     def name(self) -> str:
         """
         Instruction name accessor
@@ -226,7 +226,7 @@ def e_to_a(hardware: Hardware) -> None:
     """
     storage = hardware.storage
     storage.e_to_z()
-    storage.z_to_a()
+    storage.a_register = storage.z_register
 
 def error(hardware: Hardware) -> None:
     """
@@ -513,8 +513,8 @@ def rotate_a_left_one(hardware: Hardware) -> None:
     :return: None
     """
     storage = hardware.storage
-    end_around = 0 if storage.a_register & 0o4000 == 0 else 1
-    storage.a_register = ((storage.a_register << 1) & 0o7777) | end_around
+    a = storage.a_register
+    storage.a_register = ((a << 1) & 0o7777) | (a >> 11)
 
 def rotate_a_left_two(hardware: Hardware) -> None:
     """
@@ -526,8 +526,8 @@ def rotate_a_left_two(hardware: Hardware) -> None:
     :return: None
     """
     storage = hardware.storage
-    end_around = (storage.a_register & 0o6000) >> 10
-    storage.a_register = ((storage.a_register << 2) & 0o7777) | end_around
+    a = storage.a_register
+    storage.a_register = ((a << 2) & 0o7777) | (a >> 10)
 
 def rotate_a_left_six(hardware: Hardware) -> None:
     """
@@ -539,8 +539,8 @@ def rotate_a_left_six(hardware: Hardware) -> None:
     :return: None
     """
     storage = hardware.storage
-    end_around = (storage.a_register & 0o7700) >> 6
-    storage.a_register = ((storage.a_register << 6) & 0o7777) | end_around
+    a = storage.a_register
+    storage.a_register = ((a << 6) & 0o7777) | (a >> 6)
 
 def rotate_a_left_three(hardware: Hardware) -> None:
     """
@@ -552,8 +552,8 @@ def rotate_a_left_three(hardware: Hardware) -> None:
     :return: None
     """
     storage = hardware.storage
-    end_around = (storage.a_register & 0o7000) >> 9
-    storage.a_register = ((storage.a_register << 3) & 0O7777) | end_around
+    a = storage.a_register
+    storage.a_register = ((a << 3) & 0o7777) | (a >> 9)
 
 def selective_complement_direct(hardware: Hardware) -> None:
     """
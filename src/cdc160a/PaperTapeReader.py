@@ -22,7 +22,7 @@ with the System Source Museum Control Data 160-A Emulator. If not, see
 """
 
 from cdc160a.Device import Device, ExternalFunctionAction, IOChannelSupport
-from typing import Optional
+from typing import Optional, TextIO
 import re
 
 class PaperTapeReader(Device):
@@ -84,15 +84,27 @@ class PaperTapeReader(Device):
     def is_open(self) -> bool:
         return self.__input_file is not None
 
-    def open(self, path_name: str) -> bool:
-        result = False
-        if self.__input_file is not None:
+    def __already_open(self, name: str) -> bool:
+        """
+        Check whether the reader already has input open, and say so if
+        it does.
+
+        :param name: name of the file or stream that the caller wants
+               to open
+        :return: True if input is already open, False otherwise
+        """
+        already_open = self.__input_file is not None
+        if already_open:
             print(
                 "Cannot open {0} for paper tape input because "
-                "{1}} is already open".format(
-                    path_name,
+                "{1} is already open".format(
+                    name,
                     self.__input_path_name))
-        else:
+        return already_open
+
+    def open(self, path_name: str) -> bool:
+        result = False
+        if not self.__already_open(path_name):
             try:
                 self.__input_file = open(path_name, 'r')
                 self.__input_path_name = path_name
@@ -101,6 +113,26 @@ class PaperTapeReader(Device):
                 print("File {0} does not exist.".format(path_name))
         return result
 
+    def open_stream(self, stream: TextIO, stream_name: str) -> bool:
+        """
+        Attach the reader to an already open text stream, e.g. an
+        io.StringIO holding a short test tape. The stream must have
+        the same format as a paper tape file. Closing the reader closes
+        the stream.
+
+        :param stream: the text stream to read
+        :param stream_name: the name that file_name() reports for the
+               stream
+        :return: True if the stream was attached, False if the reader
+                 already has input open.
+        """
+        result = False
+        if not self.__already_open(stream_name):
+            self.__input_file = stream
+            self.__input_path_name = stream_name
+            result = True
+        return result
+
     def read(self) -> (bool, int):
         read_data = 0
         status = self.__input_file is not None
@@ -57,8 +57,8 @@ class RunLoop:
         self.__console.before_instruction_fetch(self.__storage, self.__input_output)
         self.__storage.service_pending_interrupts()
         self.__storage.unpack_instruction()
-        decoder = InstructionDecoder.decoder_at(self.__storage.f_instruction)
-        current_instruction = decoder.decode(self.__storage.f_e)
+        current_instruction = InstructionDecoder.decode_word(
+            self.__storage.z_register)
         current_instruction.determine_effective_address(self.__storage)
         self.__console.before_instruction_logic(self.__storage, self.__input_output)
         elapsed_cycles = current_instruction.perform_logic(self.__hardware)
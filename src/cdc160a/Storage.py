@@ -57,6 +57,44 @@ class Storage:
         https://archive.org/details/bitsavers_cdc160023aingManual1960_4826291
     """
 
+    # Storage state is fixed; see the constructor for descriptions. Slots
+    # speed register access and catch misspelled register names.
+    __slots__ = (
+        "memory",
+        "a_register",
+        "aprime_register",
+        "buffer_data_register",
+        "buffer_entrance_register",
+        "buffer_exit_register",
+        "buffering",
+        "f_instruction",
+        "f_e",
+        "interrupt_lock",
+        "normal_io_status",
+        "interrupt_requests",
+        "punch_storage_register",
+        "p_register",
+        "s_register",
+        "z_register",
+        "buffer_storage_bank",
+        "direct_storage_bank",
+        "indirect_storage_bank",
+        "relative_storage_bank",
+        "z_contains_instruction_address",
+        "run_stop_status",
+        "err_status",
+        "sel_status",
+        "out_status",
+        "in_status",
+        "iba_status",
+        "oba_status",
+        "machine_hung",
+        "storage_cycle",
+        "__next_address",
+        "__jump_switch_mask",
+        "__stop_switch_mask",
+    )
+
     def __init__(self):
         """
         Constructor
@@ -635,11 +673,15 @@ class Storage:
         bits, the effective address, into the E register. Note that the
         E register has no counterpart in the real computer.
 
+        The instruction is read with item() so that Z, F, and E hold
+        Python ints; arithmetic and table lookups on NumPy scalars are
+        several times slower.
+
         :return: None
         """
         self.p_to_s()
-        self.z_register = self.memory[
-            self.relative_storage_bank, self.s_register]
+        self.z_register = self.memory.item(
+            self.relative_storage_bank, self.s_register)
         self.f_e = self.z_register & 0o77
         self.f_instruction = (self.z_register >> 6) & 0o77
 
@@ -755,6 +797,17 @@ class Storage:
         """
         self.s_register = self.p_register + self.f_e
 
+    def relative_bank_view(self) -> np.ndarray:
+        """
+        Return a view of the current relative storage bank. The view shares
+        memory with storage, so writes through it land in the bank directly,
+        without the 12-bit masking that write_relative_bank() applies.
+        Changing the relative storage bank does not move an existing view.
+
+        :return: a 4096-word view of the relative storage bank
+        """
+        return self.memory[self.relative_storage_bank]
+
     def s_to_p(self) -> None:
         """
         Move the contents of the S (i.e. effective address) register
@@ -913,7 +966,7 @@ class Storage:
 
     def specific_to_a(self) -> None:
         self.specific_to_z()
-        self.z_to_a()
+        self.a_register = self.z_register
 
     def specific_to_z(self) -> None:
         self.z_register = self.memory[0o0, 0o7777]
@@ -952,7 +1005,7 @@ class Storage:
         :return: None
         """
         self.s_direct_to_z()
-        self.z_to_a()
+        self.a_register = self.z_register
 
     def s_direct_to_z(self) -> None:
         """
@@ -966,7 +1019,7 @@ class Storage:
 
     def s_indirect_to_a(self) -> None:
         self.s_indirect_to_z()
-        self.z_to_a()
+        self.a_register = self.z_register
 
     def s_indirect_to_z(self) -> None:
         self.s_absolute_to_z(self.indirect_storage_bank)
@@ -974,7 +1027,7 @@ class Storage:
 
     def s_relative_to_a(self) -> None:
         self.s_relative_to_z()
-        self.z_to_a()
+        self.a_register = self.z_register
 
     def s_relative_to_next_address(self) -> None:
         """
@@ -1134,9 +1187,6 @@ class Storage:
         """
         self.a_register ^= self.z_register
 
-    def z_to_a(self) -> None:
-        self.a_register = self.z_register
-
     def z_to_next_address(self) -> None:
         self.__next_address = self.z_register
 
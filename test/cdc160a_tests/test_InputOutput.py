@@ -177,7 +177,6 @@ class TestInputOutput(TestCase):
     def test_clear(self) -> None:
         with NamedTemporaryFile("w+", delete=False) as temp_file:
             temp_file_name = temp_file.name
-            print("Temporary file: {0},".format(temp_file.name))
             temp_file.write("0\n7\n007\n456\n")
         assert self.__paper_tape_reader.open(temp_file_name)
         self.__bi_tape.set_online_status(True)
@@ -230,7 +229,6 @@ class TestInputOutput(TestCase):
 
     def test_select_valid_device(self) -> None:
         temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
         temp_file.write("0\n7\n007\n456\n")
         temp_file.close()
 
@@ -263,7 +261,6 @@ class TestInputOutput(TestCase):
 
     def test_read_device_ready(self) -> None:
         temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
         temp_file.write("456\n")
         temp_file.close()
 
@@ -25,11 +25,34 @@ import unittest
 from unittest import TestCase
 
 from InstructionDecoder import decode
+from InstructionDecoder import decode_word
 from InstructionDecoder import decoder_at
 from cdc160a import InstructionDecoder
 from cdc160a import Instructions
 
+# Decoders for every opcode, resolved once at import rather than in
+# every test.
+DECODERS = tuple(InstructionDecoder.decoder_at(op) for op in range(0o100))
+
 class Test(TestCase):
+
+    def assert_decodes(
+            self, decoder, first: int, limit: int, expected_name: str) -> None:
+        """
+        Verify that every E in [first, limit) decodes to the named instruction.
+
+        :param decoder: the opcode decoder under test
+        :param first: the first E value to check
+        :param limit: one past the last E value to check
+        :param expected_name: the expected instruction name
+        """
+        if not all(decoder.decode(e).name() == expected_name
+                   for e in range(first, limit)):
+            e = next(e for e in range(first, limit)
+                     if decoder.decode(e).name() != expected_name)
+            self.fail(f"Opcode {decoder.opcode:02o}, E {e:02o}: expected "
+                      f"{expected_name}, got {decoder.decode(e).name()}")
+
     def test_singleton(self):
         target = InstructionDecoder.Singleton(Instructions.ERR, 0)
         for e in range(0o00, 0o77):
@@ -52,6 +75,32 @@ class Test(TestCase):
         assert decoder_00.opcode == 0o01
 
 
+    def test_decoder_opcodes(self) -> None:
+        for opcode, decoder in enumerate(DECODERS):
+            assert decoder.opcode == opcode, \
+                f"Decoder at {opcode:02o} has opcode {decoder.opcode:02o}"
+
+    def test_decode_matches_decoders(self) -> None:
+        mismatches = [
+            (f, e) for f, decoder in enumerate(DECODERS) for e in range(0o100)
+            if decode(f, e) is not decoder.decode(e)]
+        assert not mismatches, \
+            "decode() differs from the opcode decoders at (F, E) " + \
+            ", ".join(f"({f:02o}, {e:02o})" for f, e in mismatches[:8])
+
+    def test_decode_keeps_e_out_of_f(self) -> None:
+        assert decode(0o04, 0o177) is decode(0o04, 0o77)
+        assert decode(0o104, 0o77) is decode(0o04, 0o77)
+
+    def test_decode_word_matches_decode(self) -> None:
+        for word in range(0o10000):
+            assert decode_word(word) is decode(word >> 6, word & 0o77), \
+                f"decode_word({word:04o}) differs from decode()"
+
+    def test_decode_word_out_of_range(self) -> None:
+        assert decode_word(0o10000 | 0o0400) is decode_word(0o0400)
+        assert decode_word(-1) is decode_word(0o7777)
+
     def test_decode_singleton(self) -> None:
         assert decoder_at(0o04).opcode == 0o04
         expected_instruction = Instructions.LDN
@@ -60,29 +109,19 @@ class Test(TestCase):
             assert instruction.name() == expected_instruction.name()
 
     def test_decode_00(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o00)
-        assert decoder.opcode == 0o00
+        decoder = DECODERS[0o00]
         assert decoder.decode(0o00).name() == "ERR"
-        for e in range(0o01, 0o10):
-            assert decoder.decode(e).name() == "NOP"
-        for e in range(0o10, 0o20):
-            assert decoder.decode(e).name() == "SRJ"
-        for e in range(0o20, 0o30):
-            assert decoder.decode(e).name() == "SIC"
-        for e in range(0o30, 0o40):
-            assert decoder.decode(e).name() == "IRJ"
-        for e in range(0o40, 0o50):
-            assert decoder.decode(e).name() == "SDC"
-        for e in range(0o50, 0o60):
-            assert decoder.decode(e).name() == "DRJ"
-        for e in range(0o60, 0o70):
-            assert decoder.decode(e).name() == "SID"
-        for e in range(0o70, 0o100):
-            assert decoder.decode(e).name() == "ACJ"
+        self.assert_decodes(decoder, 0o01, 0o10, "NOP")
+        self.assert_decodes(decoder, 0o10, 0o20, "SRJ")
+        self.assert_decodes(decoder, 0o20, 0o30, "SIC")
+        self.assert_decodes(decoder, 0o30, 0o40, "IRJ")
+        self.assert_decodes(decoder, 0o40, 0o50, "SDC")
+        self.assert_decodes(decoder, 0o50, 0o60, "DRJ")
+        self.assert_decodes(decoder, 0o60, 0o70, "SID")
+        self.assert_decodes(decoder, 0o70, 0o100, "ACJ")
 
     def test_decode_01(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0x01)
-        assert decoder.opcode == 0o01
+        decoder = DECODERS[0o01]
         for e in range(0o00, 0o100):
             instruction_name = decoder.decode(e).name()
             if 0o40 <= e < 0o50:
@@ -138,402 +177,282 @@ class Test(TestCase):
                                f"At {e} expected ERR and got {instruction_name}"
 
     def test_decode_02(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o02)
-        assert decoder.opcode == 0o02
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "LPN"
+        decoder = DECODERS[0o02]
+        self.assert_decodes(decoder, 0, 0o100, "LPN")
 
     def test_decode_03(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o03)
-        assert decoder.opcode == 0o03
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "SCN"
+        decoder = DECODERS[0o03]
+        self.assert_decodes(decoder, 0, 0o100, "SCN")
 
     def test_decode_04(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o04)
-        assert decoder.opcode == 0o04
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "LDN"
+        decoder = DECODERS[0o04]
+        self.assert_decodes(decoder, 0, 0o100, "LDN")
 
     def test_decode_05(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o05)
-        assert decoder.opcode == 0o05
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "LCN"
+        decoder = DECODERS[0o05]
+        self.assert_decodes(decoder, 0o00, 0o100, "LCN")
 
     def test_decode_06(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o06)
-        assert decoder.opcode == 0o06
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "ADN"
+        decoder = DECODERS[0o06]
+        self.assert_decodes(decoder, 0o00, 0o100, "ADN")
 
     def test_decode_07(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o07)
-        assert decoder.opcode == 0o07
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "SBN"
+        decoder = DECODERS[0o07]
+        self.assert_decodes(decoder, 0, 0o100, "SBN")
 
     def test_decode_10(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o10)
-        assert decoder.opcode == 0o10
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "LPD"
+        decoder = DECODERS[0o10]
+        self.assert_decodes(decoder, 0, 0o100, "LPD")
 
     def test_decode_11(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o11)
-        assert decoder.opcode == 0o11
+        decoder = DECODERS[0o11]
         assert decoder.decode(0o00).name() == "LPM"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "LPI"
+        self.assert_decodes(decoder, 0o01, 0o100, "LPI")
 
     def test_decode_12(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o12)
-        assert decoder.opcode == 0o12
+        decoder = DECODERS[0o12]
         assert decoder.decode(0o00).name() == "LPC"
-        for e in (0o01, 0o100):
-            assert decoder.decode(e).name() == "LPF"
+        self.assert_decodes(decoder, 0o01, 0o100, "LPF")
 
     def test_decode_13(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o13)
-        assert decoder.opcode == 0o13
+        decoder = DECODERS[0o13]
         assert decoder.decode(0o00).name() == "LPS"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "LPB"
+        self.assert_decodes(decoder, 0o01, 0o100, "LPB")
 
     def test_decode_14(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o14)
-        assert decoder.opcode == 0o14
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "SCD"
+        decoder = DECODERS[0o14]
+        self.assert_decodes(decoder, 0, 0o100, "SCD")
 
     def test_decode_15(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o15)
-        assert decoder.opcode == 0o15
+        decoder = DECODERS[0o15]
         assert decoder.decode(0).name() == "SCM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SCI"
+        self.assert_decodes(decoder, 1, 0o100, "SCI")
 
     def test_decode_16(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o16)
+        decoder = DECODERS[0o16]
         assert decoder.decode(0).name() == "SCC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SCF"
+        self.assert_decodes(decoder, 1, 0o100, "SCF")
 
     def test_decode_17(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o17)
-        assert decoder.opcode == 0o17
+        decoder = DECODERS[0o17]
         assert decoder.decode(0).name() == "SCS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SCB"
+        self.assert_decodes(decoder, 1, 0o100, "SCB")
 
     def test_decode_20(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o20)
-        assert decoder.opcode == 0o20
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "LDD"
+        decoder = DECODERS[0o20]
+        self.assert_decodes(decoder, 0, 0o100, "LDD")
 
     def test_decode_21(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o21)
-        assert decoder.opcode == 0o21
+        decoder = DECODERS[0o21]
         assert decoder.decode(0).name() == "LDM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LDI"
+        self.assert_decodes(decoder, 1, 0o100, "LDI")
 
     def test_decode_22(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o22)
-        assert decoder.opcode == 0o22
+        decoder = DECODERS[0o22]
         assert decoder.decode(0).name() == "LDC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LDF"
+        self.assert_decodes(decoder, 1, 0o100, "LDF")
 
     def test_decode_23(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o23)
-        assert decoder.opcode == 0o23
+        decoder = DECODERS[0o23]
         assert decoder.decode(0).name() == "LDS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LDB"
+        self.assert_decodes(decoder, 1, 0o100, "LDB")
 
     def test_decode_24(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o24)
-        assert decoder.opcode == 0o24
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "LCD"
+        decoder = DECODERS[0o24]
+        self.assert_decodes(decoder, 0, 0o100, "LCD")
 
     def test_decode_25(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o25)
-        assert decoder.opcode == 0o25
+        decoder = DECODERS[0o25]
         assert decoder.decode(0).name() == "LCM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LCI"
+        self.assert_decodes(decoder, 1, 0o100, "LCI")
 
     def test_decode_26(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o26)
-        assert decoder.opcode == 0o26
+        decoder = DECODERS[0o26]
         assert decoder.decode(0).name() == "LCC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LCF"
+        self.assert_decodes(decoder, 1, 0o100, "LCF")
 
     def test_decode_27(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o27)
-        assert decoder.opcode == 0o27
+        decoder = DECODERS[0o27]
         assert decoder.decode(0).name() == "LCS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "LCB"
+        self.assert_decodes(decoder, 1, 0o100, "LCB")
 
     def test_decode_30(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o30)
-        assert decoder.opcode == 0o30
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "ADD"
+        decoder = DECODERS[0o30]
+        self.assert_decodes(decoder, 0o00, 0o100, "ADD")
 
     def test_decode_31(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o31)
-        assert decoder.opcode == 0o31
+        decoder = DECODERS[0o31]
         assert decoder.decode(0).name() == "ADM"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "ADI"
+        self.assert_decodes(decoder, 0o01, 0o100, "ADI")
 
     def test_decode_32(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o32)
-        assert decoder.opcode == 0o32
+        decoder = DECODERS[0o32]
         assert decoder.decode(0).name() == "ADC"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "ADF"
+        self.assert_decodes(decoder, 0o01, 0o100, "ADF")
 
     def test_decode_34(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o34)
-        assert decoder.opcode == 0o34
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "SBD"
+        decoder = DECODERS[0o34]
+        self.assert_decodes(decoder, 0o00, 0o100, "SBD")
 
     def test_decode_35(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o35)
-        assert decoder.opcode == 0o35
+        decoder = DECODERS[0o35]
         assert decoder.decode(0o00).name() == "SBM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SBI"
+        self.assert_decodes(decoder, 1, 0o100, "SBI")
 
     def test_decode_36(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o36)
-        assert decoder.opcode == 0o36
+        decoder = DECODERS[0o36]
         assert decoder.decode(0o00).name() == "SBC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SBF"
+        self.assert_decodes(decoder, 1, 0o100, "SBF")
 
     def test_decode_37(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o37)
-        assert decoder.opcode == 0o37
+        decoder = DECODERS[0o37]
         assert decoder.decode(0).name() == "SBS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SBB"
+        self.assert_decodes(decoder, 1, 0o100, "SBB")
 
     def test_decode_40(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o40)
-        assert decoder.opcode == 0o40
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "STD"
+        decoder = DECODERS[0o40]
+        self.assert_decodes(decoder, 0, 0o100, "STD")
 
     def test_decode_41(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o41)
-        assert decoder.opcode == 0o41
+        decoder = DECODERS[0o41]
         assert decoder.decode(0).name() == "STM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "STI"
+        self.assert_decodes(decoder, 1, 0o100, "STI")
 
     def test_decode_42(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o42)
-        assert decoder.opcode == 0o42
+        decoder = DECODERS[0o42]
         assert decoder.decode(0).name() == "STC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "STF"
+        self.assert_decodes(decoder, 1, 0o100, "STF")
 
     def test_decode_43(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o43)
-        assert decoder.opcode == 0o43
+        decoder = DECODERS[0o43]
         assert decoder.decode(0).name() == "STS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "STB"
+        self.assert_decodes(decoder, 1, 0o100, "STB")
 
     def test_decode_44(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o44)
-        assert decoder.opcode == 0o44
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "SRD"
+        decoder = DECODERS[0o44]
+        self.assert_decodes(decoder, 0, 0o100, "SRD")
 
     def test_decode_45(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o45)
-        assert decoder.opcode == 0o45
+        decoder = DECODERS[0o45]
         assert decoder.decode(0).name() == "SRM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SRI"
+        self.assert_decodes(decoder, 1, 0o100, "SRI")
 
     def test_decode_46(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o46)
-        assert decoder.opcode == 0o46
+        decoder = DECODERS[0o46]
         assert decoder.decode(0).name() == "SRC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SRF"
+        self.assert_decodes(decoder, 1, 0o100, "SRF")
 
     def test_decode_47(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o47)
-        assert decoder.opcode == 0o47
+        decoder = DECODERS[0o47]
         assert decoder.decode(0).name() == "SRS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "SRB"
+        self.assert_decodes(decoder, 1, 0o100, "SRB")
 
     def test_decode_50(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o50)
-        assert decoder.opcode == 0o50
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "RAD"
+        decoder = DECODERS[0o50]
+        self.assert_decodes(decoder, 0, 0o100, "RAD")
 
     def test_decide_51(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o51)
-        assert decoder.opcode == 0o51
+        decoder = DECODERS[0o51]
         assert decoder.decode(0o00).name() == "RAM"
-        for e in (1, 0o100):
-            assert decoder.decode(e).name() == "RAI"
+        self.assert_decodes(decoder, 1, 0o100, "RAI")
 
     def test_decode_52(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o52)
-        assert decoder.opcode == 0o52
+        decoder = DECODERS[0o52]
         assert decoder.decode(0).name() == "RAC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "RAF"
+        self.assert_decodes(decoder, 1, 0o100, "RAF")
 
     def test_decode_53(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o53)
-        assert decoder.opcode == 0o53
+        decoder = DECODERS[0o53]
         assert decoder.decode(0).name() == "RAS"
-        for e in range(1, 0o100):
-            assert decoder.decode(3).name() == "RAB"
+        self.assert_decodes(decoder, 1, 0o100, "RAB")
 
     def test_decode_54(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o54)
-        assert decoder.opcode == 0o54
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "AOD"
+        decoder = DECODERS[0o54]
+        self.assert_decodes(decoder, 0, 0o100, "AOD")
 
     def test_decode_55(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o55)
-        assert decoder.opcode == 0o55
+        decoder = DECODERS[0o55]
         assert decoder.decode(0o00).name() == "AOM"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "AOI"
+        self.assert_decodes(decoder, 1, 0o100, "AOI")
 
     def test_decode_56(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o56)
-        assert decoder.opcode == 0o56
+        decoder = DECODERS[0o56]
         assert decoder.decode(0).name() == "AOC"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "AOF"
+        self.assert_decodes(decoder, 1, 0o100, "AOF")
 
     def test_decode_57(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o57)
-        assert decoder.opcode == 0o57
+        decoder = DECODERS[0o57]
         assert decoder.decode(0).name() == "AOS"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "AOB"
+        self.assert_decodes(decoder, 1, 0o100, "AOB")
 
     def test_decode_60(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o60)
-        assert decoder.opcode == 0o60
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "ZJF"
+        decoder = DECODERS[0o60]
+        self.assert_decodes(decoder, 0o00, 0o100, "ZJF")
 
     def test_decode_61(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o61)
-        assert decoder.opcode == 0o61
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "NZF"
+        decoder = DECODERS[0o61]
+        self.assert_decodes(decoder, 0o00, 0o100, "NZF")
 
     def test_decode_62(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o62)
-        assert decoder.opcode == 0o62
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "PJF"
+        decoder = DECODERS[0o62]
+        self.assert_decodes(decoder, 0o00, 0o100, "PJF")
 
     def test_decode_63(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o63)
-        assert decoder.opcode == 0o63
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "NJF"
+        decoder = DECODERS[0o63]
+        self.assert_decodes(decoder, 0o00, 0o100, "NJF")
 
     def test_decode_64(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o64)
-        assert decoder.opcode == 0o64
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "ZJB"
+        decoder = DECODERS[0o64]
+        self.assert_decodes(decoder, 0o00, 0o100, "ZJB")
 
     def test_decode_65(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o65)
-        assert decoder.opcode == 0o65
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "NZB"
+        decoder = DECODERS[0o65]
+        self.assert_decodes(decoder, 0o00, 0o100, "NZB")
 
     def test_decode_66(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o66)
-        assert decoder.opcode == 0o66
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "PJB"
+        decoder = DECODERS[0o66]
+        self.assert_decodes(decoder, 0o00, 0o100, "PJB")
 
     def test_decode_67(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o67)
-        assert decoder.opcode == 0o67
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "NJB"
+        decoder = DECODERS[0o67]
+        self.assert_decodes(decoder, 0o00, 0o100, "NJB")
 
     def test_decode_70(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o70)
-        assert decoder.opcode == 0o70
-        for e in range(0, 0o100):
-            assert decoder.decode(e).name() == "JPI"
+        decoder = DECODERS[0o70]
+        self.assert_decodes(decoder, 0, 0o100, "JPI")
 
     def test_decode_71(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o71)
-        assert decoder.opcode == 0o71
+        decoder = DECODERS[0o71]
         assert decoder.decode(0).name() == "JPR"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "JFI"
+        self.assert_decodes(decoder, 1, 0o100, "JFI")
 
     def test_decode_72(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o72)
-        assert decoder.opcode == 0o72
+        decoder = DECODERS[0o72]
         assert decoder.decode(0).name() == "IBI"
-        for e in range(1, 0o100):
-            assert decoder.decode(e).name() == "INP"
+        self.assert_decodes(decoder, 1, 0o100, "INP")
 
     def test_decode_73(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o73)
-        assert decoder.opcode == 0o73
+        decoder = DECODERS[0o73]
         assert decoder.decode(0o00).name() == "IBO"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "OUT"
+        self.assert_decodes(decoder, 0o01, 0o100, "OUT")
 
     def test_decode_74(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o74)
-        assert decoder.opcode == 0o74
-        for e in range(0o00, 0o100):
-            assert decoder.decode(e).name() == "OTN"
+        decoder = DECODERS[0o74]
+        self.assert_decodes(decoder, 0o00, 0o100, "OTN")
 
     def test_decode_75(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o75)
-        assert decoder.opcode == 0o75
+        decoder = DECODERS[0o75]
         assert decoder.decode(0o00).name() == "EXC"
-        for e in range(0o01, 0o100):
-            assert decoder.decode(e).name() == "EXF"
+        self.assert_decodes(decoder, 0o01, 0o100, "EXF")
 
     def test_decode_76(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o76)
-        assert decoder.opcode == 0o76
+        decoder = DECODERS[0o76]
         assert decoder.decode(0o00).name() == "INA"
-        for e in range(0o01, 0o77):
-            assert decoder.decode(e).name() == "HWI"
+        self.assert_decodes(decoder, 0o01, 0o77, "HWI")
         assert decoder.decode(0o77).name() == "OTA"
 
     def test_decode_77(self) -> None:
-        decoder = InstructionDecoder.decoder_at(0o77)
-        assert decoder.opcode == 0o77
+        decoder = DECODERS[0o77]
         assert decoder.decode(0o00).name() == "HLT"
         assert decoder.decode(0o77).name() == "HLT"
         for e in range(0o01, 0o77):
@@ -544,5 +463,6 @@ class Test(TestCase):
                 expected_name = "SLS"
             assert decoder.decode(e).name() == expected_name
 
-    if __name__ == "__main__":
-        unittest.main()
+
+if __name__ == "__main__":
+    unittest.main()
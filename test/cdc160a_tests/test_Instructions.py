@@ -23,12 +23,22 @@ with the System Source Museum Control Data 160-A Emulator. If not, see
 
 import unittest
 from unittest import TestCase
-import os
-from tempfile import NamedTemporaryFile
+import io
+import numpy as np
 
 from cdc160a.Hardware import Hardware
 from cdc160a.InputOutput import InitiationStatus, InputOutput
+from cdc160a.InstructionDecoder import decode
 from cdc160a import Instructions
+from cdc160a.Instructions import (ACJ, ADB, ADC, ADD, ADF, ADI, ADM, ADN, ADS,
+    AOB, AOC, AOD, AOF, AOI, AOM, ATE, ATX, BLS, CBC, CIL, CTA, DRJ, ERR, EXC,
+    EXF, HLT, HWI, IBI, IBO, INA, INP, IRJ, JFI, JPI, JPR, LCB, LCC, LCD, LCF,
+    LCI, LCM, LCN, LCS, LDB, LDC, LDD, LDF, LDI, LDM, LDN, LDS, LPB, LPC, LPD,
+    LPF, LPI, LPM, LPN, LPS, LS1, LS2, LS3, LS6, MUH, MUT, NJB, NJF, NOP, NZB,
+    NZF, OTA, OTN, OUT, PJB, PJF, PTA, RAB, RAC, RAD, RAF, RAI, RAM, RAS, RS1,
+    RS2, SBB, SBC, SBD, SBF, SBI, SBM, SBN, SBS, SBU, SCB, SCC, SCD, SCF, SCI,
+    SCM, SCN, SCS, SDC, SIC, SID, SJS, SLJ, SLS, SRB, SRC, SRD, SRF, SRI, SRJ,
+    SRM, SRS, STB, STC, STD, STE, STF, STI, STM, STP, STS, ZJB, ZJF)
 from cdc160a.NullDevice import NullDevice
 from cdc160a.PaperTapeReader import PaperTapeReader
 from cdc160a.Storage import InterruptLock
@@ -46,27 +56,246 @@ G_ADDRESS: Final[int] = INSTRUCTION_ADDRESS + 1
 READ_AND_WRITE_ADDRESS: Final[int] = 0o1234
 FIRST_WORD_ADDRESS: Final[int] = 0o300
 LAST_WORD_ADDRESS_PLUS_ONE: Final[int] = 0o310
+# setUp stores 0o10 + n at READ_AND_WRITE_ADDRESS in bank n.
+_READ_AND_WRITE_BANK_VALUES: Final[np.ndarray] = np.arange(
+    0o10, 0o20, dtype=np.int16)
 
 _BI_TAPE_INPUT_DATA = [
     0o7777, 0o0001, 0o0200, 0o0210, 0o1111,
     0o4001, 0o4011, 0o4111, 0o4112, 0o4122]
 
+# Add to A: instruction, instruction word, G word (None for one-word
+# instructions), effective address, bank holding the 0o21 addend (None when
+# the addend is E), cycles, and the address of the next instruction. A
+# starts at 0o1213, so every case leaves 0o1234 in A.
+_ADD_CASES = (
+    (ADB, 0o3301, None, INSTRUCTION_ADDRESS - 1, 4, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (ADC, 0o3200, 0o0021, G_ADDRESS, None, 2,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (ADD, 0o3040, None, 0o40, 2, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (ADF, 0o3202, None, INSTRUCTION_ADDRESS + 2, 4, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (ADI, 0o3140, None, 0o40, 3, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (ADM, 0o3100, READ_AND_WRITE_ADDRESS, READ_AND_WRITE_ADDRESS,
+     4, 3, AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (ADN, 0o0621, None, INSTRUCTION_ADDRESS, None, 1,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (ADS, 0o3300, None, 0o7777, 0, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+)
+
+# Load, load complement, and load logical product: instruction,
+# instruction word, G word (None for one-word instructions), effective
+# address, bank holding the operand (None when the operand is E or the G
+# word), operand, A before and after, cycles, and the address of the next
+# instruction. Memory-mode loads read the indirect bank for LDM and LCM and
+# the relative bank for LPM.
+_LOAD_CASES = (
+    (LCB, 0o2710, None, INSTRUCTION_ADDRESS - 0o10, 4, 0o5555, 0, 0o2222, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LCC, 0o2600, 0o6666, G_ADDRESS, None, 0o6666, 0, 0o1111, 2,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LCD, 0o2445, None, 0o45, 2, 0o7654, 0, 0o0123, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LCF, 0o2620, None, INSTRUCTION_ADDRESS + 0o20, 4, 0o2222, 0, 0o5555, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LCI, 0o2545, None, 0o45, 3, 0o7654, 0, 0o0123, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LCM, 0o2500, 0o0137, 0o0137, 3, 0o1370, 0, 0o6407, 3,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LCN, 0o0537, None, INSTRUCTION_ADDRESS, None, 0o37, 0, 0o7740, 1,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LCS, 0o2700, None, 0o7777, 0, 0o77, 0, 0o7700, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDB, 0o2310, None, INSTRUCTION_ADDRESS - 0o10, 4, 0o5555, 0, 0o5555, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDC, 0o2200, 0o6666, G_ADDRESS, None, 0o6666, 0, 0o6666, 2,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LDD, 0o2045, None, 0o45, 2, 0o7654, 0, 0o7654, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDF, 0o2220, None, INSTRUCTION_ADDRESS + 0o20, 4, 0o2222, 0, 0o2222, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDI, 0o2145, None, 0o45, 3, 0o7654, 0, 0o7654, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDM, 0o2100, 0o0137, 0o0137, 3, 0o1370, 0, 0o1370, 3,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LDN, 0o0437, None, INSTRUCTION_ADDRESS, None, 0o37, 0, 0o37, 1,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LDS, 0o2300, None, 0o7777, 0, 0o77, 0, 0o77, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPB, 0o1310, None, INSTRUCTION_ADDRESS - 0o10, 4, 0o77, 0o4321, 0o21, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPC, 0o1200, 0o0077, G_ADDRESS, None, 0o77, 0o4321, 0o21, 2,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LPD, 0o1040, None, 0o40, 2, 0o77, 0o4321, 0o21, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPF, 0o1201, None, INSTRUCTION_ADDRESS + 1, 4, 0o77, 0o4321, 0o21, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPI, 0o1140, None, 0o40, 3, 0o77, 0o4321, 0o21, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPM, 0o1100, 0o0140, 0o0140, 4, 0o77, 0o4321, 0o21, 3,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (LPN, 0o0277, None, INSTRUCTION_ADDRESS, None, 0o77, 0o4321, 0o21, 1,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (LPS, 0o1300, None, 0o7777, 0, 0o77, 0o4321, 0o21, 2,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+)
+
+# Replace add one: instruction, instruction word, G word (None for one-word
+# instructions), effective address, bank holding the operand, cycles, and
+# the address of the next instruction. The operand starts at 0o1233.
+_REPLACE_ADD_ONE_CASES = (
+    (AOB, 0o5701, None, INSTRUCTION_ADDRESS - 1, 4, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (AOC, 0o5600, 0o1233, G_ADDRESS, 4, 3,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (AOD, 0o5410, None, 0o10, 2, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (AOF, 0o5610, None, INSTRUCTION_ADDRESS + 0o10, 4, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (AOI, 0o5514, None, 0o14, 3, 4,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (AOM, 0o5500, 0o0200, 0o0200, 4, 4,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+)
+
+# Store A instructions: instruction, instruction word, G word (None for
+# one-word instructions), effective address, bank that receives A, cycles,
+# and the address of the next instruction. The banks match setUp: direct 2,
+# indirect 3, relative 4, and specific is bank 0.
+_STORE_A_CASES = (
+    (STB, 0o4315, None, INSTRUCTION_ADDRESS - 0o15, 4, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (STC, 0o4200, 0o1234, G_ADDRESS, 4, 3,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (STD, 0o4015, None, 0o15, 2, 3, AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (STF, 0o4210, None, INSTRUCTION_ADDRESS + 0o10, 4, 3,
+     AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (STI, 0o4114, None, 0o14, 3, 4, AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+    (STM, 0o4100, READ_AND_WRITE_ADDRESS, READ_AND_WRITE_ADDRESS, 4, 4,
+     AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS),
+    (STS, 0o4300, None, 0o7777, 0, 3, AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS),
+)
+
+# A to buffer entrance and exit: instruction, instruction word, whether
+# buffering is in progress, buffer exit register before, cycles, entrance
+# and exit registers after, and the address of the next instruction. Each
+# instruction is stored at 0o100 with a jump address of 0o1000 in G; A
+# holds 0o200. While buffering, the instructions leave the buffer limits
+# unchanged and jump to the address in G.
+_BUFFER_LIMIT_CASES = (
+    (ATE, 0o0105, True, 0o7777, 2, 0, 0o7777, 0o1000),
+    (ATE, 0o0105, False, 0, 1, 0o200, 0, 0o102),
+    (ATX, 0o0106, True, 0o7777, 2, 0, 0o7777, 0o1000),
+    (ATX, 0o0106, False, 0, 1, 0, 0o200, 0o102),
+)
+
+# Conditional jumps: instruction, instruction word, jump address, and
+# (A, jump taken) pairs covering minus zero, negative, positive, and zero.
+_CONDITIONAL_JUMP_CASES = (
+    (NJB, 0o6402, INSTRUCTION_ADDRESS - 2,
+     ((0o7777, True), (0o7776, True), (0o0001, False), (0o0000, False))),
+    (NJF, 0o6340, INSTRUCTION_ADDRESS + 0o40,
+     ((0o7777, True), (0o7776, True), (0o3777, False), (0o0000, False))),
+    (NZB, 0o6540, INSTRUCTION_ADDRESS - 0o40,
+     ((0o7777, True), (0o4000, True), (0o3777, True), (0o0000, False))),
+    (NZF, 0o6140, INSTRUCTION_ADDRESS + 0o40,
+     ((0o7777, True), (0o4000, True), (0o3777, True), (0o0000, False))),
+    (PJB, 0o6240, INSTRUCTION_ADDRESS - 0o40,
+     ((0o7777, False), (0o7776, False), (0o0001, True), (0o0000, True))),
+    (PJF, 0o6240, INSTRUCTION_ADDRESS + 0o40,
+     ((0o7777, False), (0o7776, False), (0o0001, True), (0o0000, True))),
+    (ZJB, 0o6440, INSTRUCTION_ADDRESS - 0o40,
+     ((0o7777, False), (0o7776, False), (0o0001, False), (0o0000, True))),
+    (ZJF, 0o6040, INSTRUCTION_ADDRESS + 0o40,
+     ((0o7777, False), (0o7776, False), (0o0001, False), (0o0000, True))),
+)
+
+# Shifts: instruction, instruction word, A before, and A after. Left
+# shifts are end-around; right shifts replicate the sign bit.
+_SHIFT_CASES = (
+    (LS1, 0o0102, 0o4001, 0o0003),
+    (LS2, 0o0103, 0o6001, 0o0007),
+    (LS3, 0o0110, 0o7000, 0o0007),
+    (LS6, 0o0111, 0o3412, 0o1234),
+    (RS1, 0o0114, 0o4020, 0o6010),
+    (RS2, 0o0115, 0o0007, 0o0001),
+    (RS2, 0o0115, 0o4007, 0o7001),
+)
+
+# A straight-line program, stored from INSTRUCTION_ADDRESS, that exercises
+# loads, stores, arithmetic, shifts, and forward jumps in a single run.
+_TRACE_PROGRAM = (
+    0o0412,  # +00 LDN 12
+    0o0605,  # +01 ADN 5
+    0o4020,  # +02 STD 20
+    0o0503,  # +03 LCN 3
+    0o3020,  # +04 ADD 20
+    0o0704,  # +05 SBN 4
+    0o0102,  # +06 LS1
+    0o4210,  # +07 STF 10, stores at +17
+    0o0400,  # +10 LDN 0
+    0o2206,  # +11 LDF 6, loads from +17
+    0o6002,  # +12 ZJF 2, not taken
+    0o6102,  # +13 NZF 2, taken
+    0o7700,  # +14 HLT, skipped
+    0o0217,  # +15 LPN 17
+)
+
+# P (relative to INSTRUCTION_ADDRESS) and A after each step of
+# _TRACE_PROGRAM.
+_TRACE_STATES = (
+    (0o01, 0o0012),
+    (0o02, 0o0017),
+    (0o03, 0o0017),
+    (0o04, 0o7774),
+    (0o05, 0o0014),
+    (0o06, 0o0010),
+    (0o07, 0o0020),
+    (0o10, 0o0020),
+    (0o11, 0o0000),
+    (0o12, 0o0020),
+    (0o13, 0o0020),
+    (0o15, 0o0020),
+    (0o16, 0o0000),
+)
+
+def _store_instruction(storage: Storage, word: int) -> None:
+    """
+    Store an instruction word at INSTRUCTION_ADDRESS in the relative bank,
+    writing memory directly. Test words are always valid 12-bit values, so
+    the masking done by write_relative_bank() is not needed.
+
+    :param storage: the storage under test
+    :param word: the instruction word
+    :return: None
+    """
+    storage.memory[storage.relative_storage_bank, INSTRUCTION_ADDRESS] = word
+
 class Test(TestCase):
 
     def setUp(self) -> None:
+        self._reset_fixture()
+
+    def _reset_fixture(self) -> None:
+        """
+        Build fresh I/O devices, Storage, and Hardware, with the banks and
+        registers every test expects. setUp calls this, and so does each
+        case of a table-driven test, so that no case sees the previous
+        case's state.
+
+        :return: None
+        """
         self.bi_tape = HyperLoopQuantumGravityBiTape(_BI_TAPE_INPUT_DATA)
         self.paper_tape_reader = PaperTapeReader()
         self.input_output = InputOutput(
             [self.paper_tape_reader, self.bi_tape])
         self.storage = Storage()
-        self.storage.memory[0, READ_AND_WRITE_ADDRESS] = 0o10
-        self.storage.memory[1, READ_AND_WRITE_ADDRESS] = 0o11
-        self.storage.memory[2, READ_AND_WRITE_ADDRESS] = 0o12
-        self.storage.memory[3, READ_AND_WRITE_ADDRESS] = 0o13
-        self.storage.memory[4, READ_AND_WRITE_ADDRESS] = 0o14
-        self.storage.memory[5, READ_AND_WRITE_ADDRESS] = 0o15
-        self.storage.memory[6, READ_AND_WRITE_ADDRESS] = 0o16
-        self.storage.memory[7, READ_AND_WRITE_ADDRESS] = 0o17
+        self.storage.memory[0:8, READ_AND_WRITE_ADDRESS] = (
+            _READ_AND_WRITE_BANK_VALUES)
         self.storage.memory[0, 0o7777] = 0o77
         self.storage.p_register = INSTRUCTION_ADDRESS
         self.storage.s_register = INSTRUCTION_ADDRESS
@@ -74,343 +303,113 @@ class Test(TestCase):
         self.storage.direct_storage_bank = 2
         self.storage.indirect_storage_bank = 3
         self.storage.relative_storage_bank = 4
-        self.storage.run()
+        self.storage.run_stop_status = True
         self.hardware = Hardware(self.input_output, self.storage)
 
-    def tearDown(self) -> None:
-        self.storage = None
-        self.input_output = None
-        self.hardware = None
+    def assert_registers(self, **expected) -> None:
+        """
+        Compare the named storage attributes against their expected values
+        in a single assertion.
+
+        :param expected: expected values keyed by Storage attribute name,
+               e.g. a_register=0o1000
+        :return: None
+        """
+        actual = {name: getattr(self.storage, name) for name in expected}
+        self.assertEqual(actual, expected)
+
+    def step(self, instruction) -> int:
+        """
+        Run an instruction that has already been unpacked: determine its
+        effective address, perform its logic, post-process, and advance P.
+
+        :param instruction: the instruction to run
+        :return: the instruction's execution time in cycles
+        """
+        cycles = instruction.execute(self.hardware)
+        instruction.post_process(self.hardware)
+        self.storage.advance_to_next_instruction()
+        return cycles
 
     def test_acj(self) -> None:
-        assert Instructions.ACJ.name() == "ACJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0076)
-        self.storage.unpack_instruction()
-        self.storage.a_register = 0o200
-        Instructions.ACJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.ACJ.perform_logic(self.hardware) == 1
-        assert self.storage.direct_storage_bank == 0o06
-        assert self.storage.indirect_storage_bank == 0o06
-        assert self.storage.relative_storage_bank == 0o06
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_next_execution_address() == 0o200
-
-    def test_adb(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3301)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 1, 0o21)
-        self.storage.a_register = 0o1213
-        self.storage.unpack_instruction()
-        Instructions.ADB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 1
-        assert Instructions.ADB.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_adc(self) -> None:
-        # adc
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3200)
-        self.storage.write_relative_bank(G_ADDRESS, 0o21)
-        self.storage.a_register = 0o1213
-        self.storage.unpack_instruction()
-        Instructions.ADC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.ADC.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_add(self) -> None:
-        # add
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3040)
-        self.storage.write_direct_bank(0o40, 0o21)
-        self.storage.a_register = 0o1213
-        self.storage.unpack_instruction()
-        Instructions.ADD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o40
-        assert Instructions.ADD.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_adf(self) -> None:
-        # adf
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3202)
-        self.storage.a_register = 0o1213
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 2, 0o21)
-        self.storage.unpack_instruction()
-        Instructions.ADF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 2
-        assert Instructions.ADF.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_adi(self) -> None:
-        # adi
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3140)
-        self.storage.a_register = 0o1213
-        self.storage.write_indirect_bank(0o40, 0o21)
-        self.storage.unpack_instruction()
-        Instructions.ADI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o40
-        assert Instructions.ADI.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_adm(self) -> None:
-        # adm
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3100)
-        self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
-        self.storage.write_relative_bank(READ_AND_WRITE_ADDRESS, 0o21)
-        self.storage.a_register = 0o1213
-        Instructions.ADM.determine_effective_address(self.storage)
-        assert self.storage.s_register == READ_AND_WRITE_ADDRESS
-        assert Instructions.ADM.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_adn(self) -> None:
-        # adn
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0621)
-        self.storage.a_register = 0o1213
-        self.storage.unpack_instruction()
-        Instructions.ADN.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.ADN.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_ads(self) -> None:
-        # ads
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3300)
-        self.storage.write_absolute(0, 0o7777, 0o21)
-        self.storage.a_register = 0o1213
-        self.storage.unpack_instruction()
-        Instructions.ADS.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o7777
-        assert Instructions.ADS.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.z_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_aob(self) -> None:
-        # aob
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5701)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 1, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 1
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert Instructions.AOB.perform_logic(self.hardware) == 3
-        assert self.storage.a_register == 0o1234
-        assert self.storage.read_relative_bank(INSTRUCTION_ADDRESS - 1) == 0o1234
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-
-    def test_aoc(self) -> None:
-        # aoc
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5600)
-        self.storage.write_relative_bank(G_ADDRESS, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        assert Instructions.AOC.perform_logic(self.hardware) == 3
-        assert self.storage.read_relative_bank(G_ADDRESS) == 0o1234
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_aod(self) -> None:
-        # aod
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5410)
-        self.storage.write_direct_bank(0o10, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o10
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert Instructions.AOD.perform_logic(self.hardware) == 3
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        assert self.storage.a_register == 0o1234
-        assert self.storage.read_direct_bank(0o10) == 0o1234
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_aof(self) -> None:
-        # aof
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5610)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 0o10, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o10
-        assert Instructions.AOF.perform_logic(self.hardware) == 3
-        assert self.storage.a_register == 0o1234
-        assert self.storage.read_relative_bank(INSTRUCTION_ADDRESS + 0o10) == 0o1234
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_aoi(self) -> None:
-        # aoi
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5514)
-        self.storage.write_indirect_bank(0o14, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o14
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        assert Instructions.AOI.perform_logic(self.hardware) == 4
-        assert self.storage.a_register == 0o1234
-        assert self.storage.read_indirect_bank(0o14) == 0o1234
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_aom(self) -> None:
-        assert Instructions.AOM.name() == "AOM"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5500)
-        self.storage.write_relative_bank(G_ADDRESS, 0o200)
-        self.storage.write_relative_bank(0o200, 0o1233)
-        self.storage.unpack_instruction()
-        Instructions.AOM.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o200
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        assert Instructions.AOM.perform_logic(self.hardware) == 4
-        assert self.storage.a_register == 0o1234
-        assert self.storage.read_relative_bank(0o200) == 0o1234
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-
-    def test_ate_buffering(self) -> None:
-        assert Instructions.ATE.name() == "ATE"
-        self.storage.buffer_entrance_register = 0
-        self.storage.buffer_exit_register = 0o7777
-        self.storage.a_register = 0o200
-        self.storage.p_register = 0o100
-        self.storage.write_relative_bank(0o100, 0o0105)
-        self.storage.write_relative_bank(0o101, 0o1000)
-        self.storage.unpack_instruction()
-        self.storage.start_buffering()
-        Instructions.ATE.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o100
-        assert Instructions.ATE.perform_logic(self.hardware) == 2
-        assert self.storage.buffer_entrance_register == 0
-        assert self.storage.buffer_exit_register == 0o7777
-        assert self.storage.buffering
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o1000
-
-    def test_ate_not_buffering(self) -> None:
-        self.storage.buffer_entrance_register = 0
-        self.storage.buffer_exit_register = 0
-        self.storage.a_register = 0o200
-        self.storage.p_register = 0o100
-        self.storage.write_relative_bank(0o100, 0o0105)
-        self.storage.write_relative_bank(0o101, 0o1000)
-        self.storage.unpack_instruction()
-        Instructions.ATE.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o100
-        assert Instructions.ATE.perform_logic(self.hardware) == 1
-        assert self.storage.buffer_entrance_register == 0o200
-        assert self.storage.buffer_exit_register == 0
-        assert not self.storage.buffering
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o102
-
-    def test_atx_buffering(self) -> None:
-        assert Instructions.ATX.name() == "ATX"
-        self.storage.set_buffer_storage_bank(0o1)
-        self.storage.set_direct_storage_bank(0o2)
-        self.storage.set_indirect_storage_bank(0o3)
-        self.storage.set_relative_storage_bank(0o4)
-        self.storage.buffer_entrance_register = 0
-        self.storage.buffer_exit_register = 0o7777
-        self.storage.a_register = 0o200
-        self.storage.p_register = 0o100
-        self.storage.write_relative_bank(0o100, 0o0105)
-        self.storage.write_relative_bank(0o101, 0o1000)
+        _store_instruction(self.storage, 0o0076)
         self.storage.unpack_instruction()
-        self.storage.start_buffering()
-        Instructions.ATX.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o100
-        assert Instructions.ATX.perform_logic(self.hardware) == 2
-        assert self.storage.buffer_entrance_register == 0
-        assert self.storage.buffer_exit_register == 0o7777
-        assert self.storage.buffering
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o1000
-
-    def test_atx_not_buffering(self) -> None:
-        assert Instructions.ATX.name() == "ATX"
-        self.storage.buffer_entrance_register = 0
-        self.storage.buffer_exit_register = 0
         self.storage.a_register = 0o200
-        self.storage.p_register = 0o100
-        self.storage.write_relative_bank(0o100, 0o0106)
-        self.storage.write_relative_bank(0o101, 0o1000)
-        self.storage.unpack_instruction()
-        Instructions.ATX.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == 0o100
-        assert Instructions.ATX.perform_logic(self.hardware) == 1
-        assert self.storage.buffer_exit_register == 0o200
-        assert self.storage.buffer_entrance_register == 0
-        assert not self.storage.buffering
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o102
+        ACJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(ACJ.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.direct_storage_bank, 0o06)
+        self.assertEqual(self.storage.indirect_storage_bank, 0o06)
+        self.assertEqual(self.storage.relative_storage_bank, 0o06)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.get_next_execution_address(), 0o200)
+
+    def test_add_to_a(self) -> None:
+        for (instruction, instruction_word, g_word, effective_address,
+             bank, cycles, next_address) in _ADD_CASES:
+            with self.subTest(instruction=instruction.name()):
+                self._reset_fixture()
+                storage = self.storage
+                _store_instruction(storage, instruction_word)
+                if g_word is not None:
+                    storage.write_relative_bank(G_ADDRESS, g_word)
+                if bank is not None:
+                    storage.write_absolute(bank, effective_address, 0o21)
+                storage.a_register = 0o1213
+                storage.unpack_instruction()
+                self.assertEqual(self.step(instruction), cycles)
+                self.assert_registers(
+                    s_register=effective_address, z_register=0o21,
+                    a_register=0o1234, p_register=next_address,
+                    run_stop_status=True, err_status=False)
+
+    def test_replace_add_one(self) -> None:
+        for (instruction, instruction_word, g_word, effective_address,
+             bank, cycles, next_address) in _REPLACE_ADD_ONE_CASES:
+            with self.subTest(instruction=instruction.name()):
+                self._reset_fixture()
+                storage = self.storage
+                _store_instruction(storage, instruction_word)
+                if g_word is not None:
+                    storage.write_relative_bank(G_ADDRESS, g_word)
+                storage.write_absolute(bank, effective_address, 0o1233)
+                storage.unpack_instruction()
+                self.assertEqual(self.step(instruction), cycles)
+                self.assertEqual(
+                        storage.read_absolute(bank, effective_address),
+                        0o1234)
+                self.assert_registers(
+                    s_register=effective_address, a_register=0o1234,
+                    p_register=next_address, run_stop_status=True,
+                    err_status=False)
+
+    def test_buffer_limits_from_a(self) -> None:
+        for (instruction, instruction_word, buffering, exit_register, cycles,
+             entrance_after, exit_after, next_address) in _BUFFER_LIMIT_CASES:
+            with self.subTest(
+                    instruction=instruction.name(), buffering=buffering):
+                self._reset_fixture()
+                storage = self.storage
+                storage.buffer_entrance_register = 0
+                storage.buffer_exit_register = exit_register
+                storage.a_register = 0o200
+                storage.p_register = 0o100
+                storage.write_relative_bank(0o100, instruction_word)
+                storage.write_relative_bank(0o101, 0o1000)
+                storage.unpack_instruction()
+                if buffering:
+                    storage.start_buffering()
+                instruction.determine_effective_address(storage)
+                self.assertEqual(storage.s_register, 0o100)
+                self.assertEqual(instruction.perform_logic(self.hardware),
+                                 cycles)
+                storage.advance_to_next_instruction()
+                self.assert_registers(
+                    buffer_entrance_register=entrance_after,
+                    buffer_exit_register=exit_after, buffering=buffering,
+                    p_register=next_address)
 
     def test_bls_buffering(self) -> None:
-        assert Instructions.BLS.name() == "BLS"
         self.storage.buffer_entrance_register = 0o200
         self.storage.buffer_exit_register = 0o401
         self.storage.a_register = 0o7654
@@ -419,17 +418,16 @@ class Test(TestCase):
         self.storage.write_relative_bank(0o101, 0o1000)
         self.storage.unpack_instruction()
         self.storage.start_buffering()
-        Instructions.BLS.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == 0o100
-        assert Instructions.BLS.perform_logic(self.hardware) == 2
-        assert self.storage.buffer_entrance_register == 0o200
-        assert self.storage.buffer_exit_register == 0o401
-        assert self.storage.buffering
+        BLS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(), 0o100)
+        self.assertEqual(BLS.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.buffer_entrance_register, 0o200)
+        self.assertEqual(self.storage.buffer_exit_register, 0o401)
+        self.assertTrue(self.storage.buffering)
         self.storage.advance_to_next_instruction()
-        assert self.storage.buffer_entrance_register == 0o200
+        self.assertEqual(self.storage.buffer_entrance_register, 0o200)
 
     def test_bls_not_buffering(self) -> None:
-        assert Instructions.BLS.name() == "BLS"
         self.storage.buffer_entrance_register = 0o200
         self.storage.buffer_exit_register = 0o401
         self.storage.a_register = 0o7654
@@ -437,282 +435,273 @@ class Test(TestCase):
         self.storage.write_relative_bank(0o100, 0o0100)
         self.storage.write_relative_bank(0o101, 0o1000)
         self.storage.unpack_instruction()
-        Instructions.BLS.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == 0o100
-        assert not self.storage.buffering
-        assert Instructions.BLS.perform_logic(self.hardware) == 0o201
-        assert self.storage.buffer_entrance_register == 0o401
-        assert self.storage.buffer_exit_register == 0o401
-        assert self.storage.read_buffer_bank(0o177) == 0
-        assert self.storage.read_buffer_bank(0o401) == 0
-        for address in range(0o200, 0o401):
-            assert self.storage.read_buffer_bank(address) == 0o7654
+        BLS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(), 0o100)
+        self.assertFalse(self.storage.buffering)
+        self.assertEqual(BLS.perform_logic(self.hardware), 0o201)
+        self.assertEqual(self.storage.buffer_entrance_register, 0o401)
+        self.assertEqual(self.storage.buffer_exit_register, 0o401)
+        self.assertEqual(self.storage.read_buffer_bank(0o177), 0)
+        self.assertEqual(self.storage.read_buffer_bank(0o401), 0)
+        buffer_bank = self.storage.memory[self.storage.buffer_storage_bank]
+        self.assertTrue(np.all(buffer_bank[0o200:0o401] == 0o7654))
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o102
+        self.assertEqual(self.storage.get_program_counter(), 0o102)
 
     def test_cbc(self) -> None:
-        assert Instructions.CBC.name() == "CBC"
         self.bi_tape.set_online_status(True)
         self.storage.buffer_entrance_register = FIRST_WORD_ADDRESS
         self.storage.buffer_exit_register = LAST_WORD_ADDRESS_PLUS_ONE
         status, valid_request = self.input_output.external_function(0o3700)
-        assert valid_request
-        assert status == 0o0001
-        assert (self.input_output.initiate_buffer_input(self.storage) ==
+        self.assertTrue(valid_request)
+        self.assertEqual(status, 0o0001)
+        self.assertEqual(
+                self.input_output.initiate_buffer_input(self.storage),
                 InitiationStatus.STARTED)
-        assert self.input_output.device_on_buffer_channel() == self.bi_tape
-        assert self.input_output.device_on_normal_channel() is None
-        Instructions.CBC.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        assert Instructions.CBC.perform_logic(self.hardware) == 1
-        assert self.input_output.device_on_buffer_channel() is None
-        assert self.input_output.device_on_normal_channel() is None
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.input_output.device_on_buffer_channel(),
+                         self.bi_tape)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        CBC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        self.assertEqual(CBC.perform_logic(self.hardware), 1)
+        self.assertIsNone(self.input_output.device_on_buffer_channel())
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_cil(self) -> None:
-        assert Instructions.CIL.name() == "CIL"
         self.storage.interrupt_lock = InterruptLock.LOCKED
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0120)
+        _store_instruction(self.storage, 0o0120)
         self.storage.unpack_instruction()
-        Instructions.CTA.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.CIL.perform_logic(self.hardware) == 1
-        assert self.storage.interrupt_lock == InterruptLock.UNLOCK_PENDING
+        CTA.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(CIL.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.interrupt_lock,
+                         InterruptLock.UNLOCK_PENDING)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_cta(self) -> None:
-        assert Instructions.CTA.name() == "CTA"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0130)
-        self.storage.set_buffer_storage_bank(0o1)
-        self.storage.set_direct_storage_bank(0o2)
-        self.storage.set_indirect_storage_bank(0o3)
-        self.storage.set_relative_storage_bank(0o4)
-        Instructions.CTA.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        Instructions.CTA.perform_logic(self.hardware)
-        assert self.storage.a_register == 0o1234
+        # setUp selects buffer bank 1, direct 2, indirect 3, relative 4.
+        _store_instruction(self.storage, 0o0130)
+        CTA.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        CTA.perform_logic(self.hardware)
+        self.assertEqual(self.storage.a_register, 0o1234)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
 
     def test_drj(self) -> None:
-        assert Instructions.DRJ.name() == "DRJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0056)
+        _store_instruction(self.storage, 0o0056)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o200
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.DRJ.perform_logic(self.hardware) == 1
-        assert self.storage.direct_storage_bank == 0o06
-        assert self.storage.relative_storage_bank == 0o06
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(DRJ.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.direct_storage_bank, 0o06)
+        self.assertEqual(self.storage.relative_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_err(self) -> None:
         # err
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0000)
+        _store_instruction(self.storage, 0o0000)
         self.storage.z_register = 0o3333
         self.storage.a_register = 0o3333
         self.storage.unpack_instruction()
-        Instructions.ERR.determine_effective_address(self.storage)
-        assert Instructions.ERR.perform_logic(self.hardware) == 1
-        assert not self.storage.run_stop_status
-        assert self.storage.err_status
-        assert self.storage.a_register == 0o3333
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.step(ERR), 1)
+        self.assertFalse(self.storage.run_stop_status)
+        self.assertTrue(self.storage.err_status)
+        self.assertEqual(self.storage.a_register, 0o3333)
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_exc(self) -> None:
-        temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
-        temp_file.write("456\n")
-        temp_file.close()
-
-        self.paper_tape_reader.open(temp_file.name)
+        self.paper_tape_reader.open_stream(io.StringIO("456\n"), "tape")
 
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7500)
+        _store_instruction(self.storage, 0o7500)
         self.storage.write_relative_bank(G_ADDRESS, 0o4102)
         self.storage.a_register = 0o5000
         self.storage.unpack_instruction()
-        Instructions.EXC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.EXC.perform_logic(self.hardware) == 2
-        assert self.storage.a_register == 0o5000
-        assert not self.storage.machine_hung
-        assert self.storage.interrupt_lock == InterruptLock.LOCKED
-        assert (self.input_output.device_on_normal_channel() ==
-                self.paper_tape_reader)
-        assert self.input_output.device_on_buffer_channel() is None
+        EXC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(EXC.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.a_register, 0o5000)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.LOCKED)
+        self.assertEqual(self.input_output.device_on_normal_channel(),
+                         self.paper_tape_reader)
+        self.assertIsNone(self.input_output.device_on_buffer_channel())
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
         self.paper_tape_reader.close()
-        os.unlink(temp_file.name)
 
-    def test_exf(self) -> None:
-        temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
-        temp_file.write("456\n")
-        temp_file.close()
+    def test_execute(self) -> None:
+        # LDM 1234, via execute(), which determines the effective address
+        # before performing the logic.
+        _store_instruction(self.storage, 0o2100)
+        self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
+        self.storage.unpack_instruction()
+        self.assertEqual(LDM.execute(self.hardware), 3)
+        self.assertEqual(self.storage.s_register, READ_AND_WRITE_ADDRESS)
+        # Memory mode operands come from the indirect bank, bank 3.
+        self.assertEqual(self.storage.a_register, 0o13)
+        self.assertEqual(self.storage.next_address(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
-        self.paper_tape_reader.open(temp_file.name)
+    def test_exf(self) -> None:
+        self.paper_tape_reader.open_stream(io.StringIO("456\n"), "tape")
 
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7540)
+        _store_instruction(self.storage, 0o7540)
         self.storage.a_register = 0o5000
         self.storage.write_relative_bank(
             INSTRUCTION_ADDRESS + 0o40, 0o4102)
         self.storage.unpack_instruction()
-        Instructions.EXF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o40
-        assert Instructions.EXF.perform_logic(self.hardware) == 2
-        assert self.storage.a_register == 0o5000
-        assert self.storage.interrupt_lock == InterruptLock.LOCKED
-        assert not self.storage.machine_hung
-        assert (self.input_output.device_on_normal_channel() ==
-                self.paper_tape_reader)
-        assert self.input_output.device_on_buffer_channel() is None
+        EXF.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS + 0o40)
+        self.assertEqual(EXF.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.a_register, 0o5000)
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.LOCKED)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertEqual(self.input_output.device_on_normal_channel(),
+                         self.paper_tape_reader)
+        self.assertIsNone(self.input_output.device_on_buffer_channel())
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
         self.paper_tape_reader.close()
-        os.unlink(temp_file.name)
 
     def test_hlt(self) -> None:
         # hlt
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7700)
+        _store_instruction(self.storage, 0o7700)
         self.storage.z_register = 0o3333
         self.storage.a_register = 0o3333
         self.storage.unpack_instruction()
-        Instructions.ERR.determine_effective_address(self.storage)
-        assert Instructions.HLT.perform_logic(self.hardware) == 1
-        assert not self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o3333
+        ERR.determine_effective_address(self.storage)
+        self.assertEqual(HLT.perform_logic(self.hardware), 1)
+        self.assertFalse(self.storage.run_stop_status)
+        self.assertFalse(self.storage.err_status)
+        self.assertEqual(self.storage.a_register, 0o3333)
         self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_hwi(self) -> None:
-        assert Instructions.HWI.name() == "HWI"
         # hwi 54
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7654)
+        _store_instruction(self.storage, 0o7654)
         self.storage.unpack_instruction()
         self.storage.write_direct_bank(0o54, 0o3200)
         self.storage.write_indirect_bank(0o3200, 0o4356)
         self.storage.a_register = 0o6521
-        Instructions.HWI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o3200
-        assert Instructions.HWI.perform_logic(self.hardware) == 4
-        assert self.storage.read_indirect_bank(0o3200) == 0o4321
-        assert self.storage.storage_cycle == MCS_MODE_IND
+        HWI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o3200)
+        self.assertEqual(HWI.perform_logic(self.hardware), 4)
+        self.assertEqual(self.storage.read_indirect_bank(0o3200), 0o4321)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_IND)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_ibi_channel_busy(self) -> None:
-        assert Instructions.IBI.name() == "IBI"
 
         # Throw the buffer channel into indefinite busy
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7200)
+        _store_instruction(self.storage, 0o7200)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBI.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBI.perform_logic(self.hardware) == 1
-        assert self.input_output.device_on_normal_channel() is None
-        assert isinstance(
-            self.input_output.device_on_buffer_channel(),
-            NullDevice)
+        IBI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBI.perform_logic(self.hardware), 1)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertIsInstance(self.input_output.device_on_buffer_channel(),
+                              NullDevice)
 
         # Now try to read the BiTape
         self.input_output.external_function(0o3700)  # Select BiTape
         self.storage.clear_interrupt_lock()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7200)
+        _store_instruction(self.storage, 0o7200)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBI.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBI.perform_logic(self.hardware) == 2
-        assert self.input_output.device_on_normal_channel() is None
-        assert isinstance(
-            self.input_output.device_on_buffer_channel(),
-            NullDevice)
+        IBI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBI.perform_logic(self.hardware), 2)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertIsInstance(self.input_output.device_on_buffer_channel(),
+                              NullDevice)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o300
+        self.assertEqual(self.storage.get_program_counter(), 0o300)
 
     def test_ibi_channel_free(self) -> None:
-        assert Instructions.IBI.name() == "IBI"
         self.input_output.external_function(0o3700)  # Select BiTape
         self.storage.clear_interrupt_lock()
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7200)
+        _store_instruction(self.storage, 0o7200)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBI.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBI.perform_logic(self.hardware) == 1
-        assert self.input_output.device_on_normal_channel() is None
-        assert self.input_output.device_on_buffer_channel() == self.bi_tape
+        IBI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBI.perform_logic(self.hardware), 1)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertEqual(self.input_output.device_on_buffer_channel(),
+                         self.bi_tape)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_ibo_channel_busy(self) -> None:
-        assert Instructions.IBO.name() == "IBO"
 
         # Throw the buffer channel into indefinite busy
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7300)
+        _store_instruction(self.storage, 0o7300)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBO.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBO.perform_logic(self.hardware) == 1
-        assert self.input_output.device_on_normal_channel() is None
-        assert isinstance(
-            self.input_output.device_on_buffer_channel(),
-            NullDevice)
+        IBO.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBO.perform_logic(self.hardware), 1)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertIsInstance(self.input_output.device_on_buffer_channel(),
+                              NullDevice)
 
         # Now try to read the BiTape
         self.input_output.external_function(0o3700)  # Select BiTape
         self.storage.clear_interrupt_lock()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7200)
+        _store_instruction(self.storage, 0o7200)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBO.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBO.perform_logic(self.hardware) == 2
-        assert self.input_output.device_on_normal_channel() is None
-        assert isinstance(
-            self.input_output.device_on_buffer_channel(),
-            NullDevice)
+        IBO.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBO.perform_logic(self.hardware), 2)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertIsInstance(self.input_output.device_on_buffer_channel(),
+                              NullDevice)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o300
+        self.assertEqual(self.storage.get_program_counter(), 0o300)
 
     def test_ibo_channel_free(self) -> None:
-        assert Instructions.IBO.name() == "IBO"
         self.input_output.external_function(0o3700)  # Select BiTape
         self.storage.clear_interrupt_lock()
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7300)
+        _store_instruction(self.storage, 0o7300)
         self.storage.write_relative_bank(G_ADDRESS, 0o300)
         self.storage.unpack_instruction()
-        Instructions.IBO.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IBO.perform_logic(self.hardware) == 1
-        assert self.input_output.device_on_normal_channel() is None
-        assert self.input_output.device_on_buffer_channel() == self.bi_tape
+        IBO.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IBO.perform_logic(self.hardware), 1)
+        self.assertIsNone(self.input_output.device_on_normal_channel())
+        self.assertEqual(self.input_output.device_on_buffer_channel(),
+                         self.bi_tape)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
     def test_inp(self) -> None:
-        assert Instructions.INP.name() == "INP"
 
-        self.storage.write_relative_bank(
-            INSTRUCTION_ADDRESS, 0o7210)
+        _store_instruction(self.storage, 0o7210)
         self.storage.write_relative_bank(
             G_ADDRESS, LAST_WORD_ADDRESS_PLUS_ONE)
         self.storage.unpack_instruction()
@@ -722,696 +711,183 @@ class Test(TestCase):
         self.bi_tape.set_online_status(True)
         status , valid_request = self.input_output.external_function(
             0o3700)
-        assert valid_request
-        assert status == 0o0001
-
-        Instructions.INP.determine_effective_address(self.storage)
-        assert self.storage.s_register == FIRST_WORD_ADDRESS
-        assert not self.storage.in_status
-        assert Instructions.INP.perform_logic(
-            self.hardware) == 0o10 * 3
-        assert not self.storage.machine_hung
-        assert self.storage.in_status
-        Instructions.INP.post_process(self.hardware)
-        assert not self.storage.in_status
-        assert self.storage.read_indirect_bank(
-            FIRST_WORD_ADDRESS - 1) == 0
-        assert self.storage.read_indirect_bank(
-            LAST_WORD_ADDRESS_PLUS_ONE) == 0
+        self.assertTrue(valid_request)
+        self.assertEqual(status, 0o0001)
+
+        INP.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, FIRST_WORD_ADDRESS)
+        self.assertFalse(self.storage.in_status)
+        self.assertEqual(INP.perform_logic(self.hardware), 0o10 * 3)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertTrue(self.storage.in_status)
+        INP.post_process(self.hardware)
+        self.assertFalse(self.storage.in_status)
+        self.assertEqual(
+                self.storage.read_indirect_bank(FIRST_WORD_ADDRESS - 1),
+                0)
+        self.assertEqual(
+                self.storage.read_indirect_bank(LAST_WORD_ADDRESS_PLUS_ONE),
+                0)
         for location in range(FIRST_WORD_ADDRESS, LAST_WORD_ADDRESS_PLUS_ONE):
             expected_value_index = location - FIRST_WORD_ADDRESS
-            assert self.storage.read_indirect_bank(
-                location) == _BI_TAPE_INPUT_DATA[expected_value_index]
+            self.assertEqual(self.storage.read_indirect_bank(location),
+                             _BI_TAPE_INPUT_DATA[expected_value_index])
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_irj(self) -> None:
-        assert Instructions.IRJ.name() == "IRJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0036)
+        _store_instruction(self.storage, 0o0036)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o200
-        Instructions.IRJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.IRJ.perform_logic(self.hardware) == 1
-        assert self.storage.indirect_storage_bank == 0o06
-        assert self.storage.relative_storage_bank == 0o06
+        IRJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(IRJ.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.indirect_storage_bank, 0o06)
+        self.assertEqual(self.storage.relative_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_ita(self) -> None:
-        assert Instructions.INA.name() == "INA"
         self.bi_tape.set_online_status(True)
         device_status, valid_request = self.input_output.external_function(
             0o3700)
-        assert valid_request
-        assert device_status == 0o0001
+        self.assertTrue(valid_request)
+        self.assertEqual(device_status, 0o0001)
         self.storage.write_relative_bank(
             self.storage.p_register, 0o7600)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o1234
         self.storage.s_register = 0o4321
-        Instructions.INA.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o4321
-        assert Instructions.INA.perform_logic(self.hardware) == 3
-        assert self.storage.a_register == 0o7777
+        INA.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o4321)
+        self.assertEqual(INA.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.a_register, 0o7777)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_jfi(self) -> None:
-        assert Instructions.JFI.name() == "JFI"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7110)
+        _store_instruction(self.storage, 0o7110)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 0o10, 0o400)
         self.storage.write_relative_bank(0o400, 0o1400)
-        Instructions.JFI.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o10
-        assert Instructions.JFI.perform_logic(self.hardware) == 2
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
+        JFI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS + 0o10)
+        self.assertEqual(JFI.perform_logic(self.hardware), 2)
+        self.assertFalse(self.storage.err_status)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o0400
+        self.assertEqual(self.storage.get_program_counter(), 0o0400)
 
     def test_jpi(self) -> None:
-        assert Instructions.JPI.name() == "JPI"
         self.storage.write_direct_bank(0o20, 0o200)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7020)
+        _store_instruction(self.storage, 0o7020)
         self.storage.unpack_instruction()
-        assert Instructions.JPI.perform_logic(self.hardware) == 2
-        assert self.storage.get_next_execution_address() == 0o200
+        self.assertEqual(JPI.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.get_next_execution_address(), 0o200)
 
     def test_jpr(self) -> None:
-        assert Instructions.JPR.name() == "JPR"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7100)
+        _store_instruction(self.storage, 0o7100)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o1000)
-        Instructions.JPR.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o1000
-        assert Instructions.JPR.perform_logic(self.hardware) == 3
-        assert (self.storage.read_relative_bank(0o1000) ==
-                INSTRUCTION_ADDRESS + 2)
-        self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o1001
-
-    def test_lcb(self) -> None:
-        # LCB 10
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2710)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 0o10, 0o5555)
-        self.storage.unpack_instruction()
-        Instructions.LCB.determine_effective_address(self.storage)
-        Instructions.LCB.perform_logic(self.hardware)
-        assert self.storage.z_register == 0O5555
-        assert self.storage.a_register == 0o5555 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lcc(self) -> None:
-        # LCC 6666
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2600)
-        self.storage.write_relative_bank(G_ADDRESS, 0o6666)
-        self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.unpack_instruction()
-        Instructions.LCC.determine_effective_address(self.storage)
-        assert Instructions.LCC.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o6666
-        assert self.storage.a_register == 0o6666 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lcd(self) -> None:
-        # LCD 45
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2445)
-        self.storage.write_direct_bank(INSTRUCTION_ADDRESS, 0o7654)
-        self.storage.unpack_instruction()
-        assert Instructions.LCD.perform_logic(self.hardware) == 2
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lcf(self) -> None:
-        # LCF 20
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2620)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 0o20, 0o2222)
-        self.storage.unpack_instruction()
-        Instructions.LCF.determine_effective_address(self.storage)
-        Instructions.LCF.perform_logic(self.hardware)
-        assert self.storage.z_register == 0o2222
-        assert self.storage.a_register ==0o2222 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lci(self) -> None:
-        # LCI 45
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2545)
-        self.storage.write_indirect_bank(0o45, 0o7654)
-        self.storage.unpack_instruction()
-        Instructions.LCI.determine_effective_address(self.storage)
-        assert Instructions.LCI.perform_logic(self.hardware) == 3
-        assert self.storage.s_register == 0o45
-        assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lcm(self) -> None:
-        # LCM 137
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2500)
-        self.storage.write_relative_bank(G_ADDRESS, 0o137)
-        self.storage.write_indirect_bank(0o137, 0o1370)
-        self.storage.unpack_instruction()
-        Instructions.LCM.determine_effective_address(self.storage)
-        assert Instructions.LCM.perform_logic(self.hardware) ==3
-        assert self.storage.s_register == 0o137
-        assert self.storage.z_register == 0o1370
-        assert self.storage.a_register == 0o1370 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_lcn(self) -> None:
-        # LCN 37
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0537)
-        self.storage.unpack_instruction()
-        Instructions.LCN.determine_effective_address(self.storage)
-        assert Instructions.LCN.perform_logic(self.hardware) == 1
-        self.storage.advance_to_next_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert self.storage.z_register == 0o37
-        assert self.storage.a_register == 0o37 ^ 0o7777
-
-    def test_lcs(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2700)
-        self.storage.unpack_instruction()
-        Instructions.LCS.determine_effective_address(self.storage)
-        assert Instructions.LCS.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o77 ^ 0o7777
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_ldb(self) -> None:
-        # LDB 10
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2310)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 0o10, 0o5555)
-        self.storage.unpack_instruction()
-        Instructions.LDB.determine_effective_address(self.storage)
-        Instructions.LDB.perform_logic(self.hardware)
-        assert self.storage.z_register == 0O5555
-        assert self.storage.a_register == 0o5555
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldc(self) -> None:
-        # LDC 6666
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2200)
-        self.storage.write_relative_bank(G_ADDRESS, 0o6666)
-        self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.unpack_instruction()
-        Instructions.LDC.determine_effective_address(self.storage)
-        assert Instructions.LDC.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o6666
-        assert self.storage.a_register == 0o6666
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldd(self) -> None:
-        # LDD 45
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2045)
-        self.storage.write_direct_bank(INSTRUCTION_ADDRESS, 0o7654)
-        self.storage.unpack_instruction()
-        assert Instructions.LDD.perform_logic(self.hardware) == 2
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldf(self) -> None:
-        # LDF 20
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2220)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 0o20, 0o2222)
-        self.storage.unpack_instruction()
-        Instructions.LDF.determine_effective_address(self.storage)
-        Instructions.LDF.perform_logic(self.hardware)
-        assert self.storage.z_register == 0o2222
-        assert self.storage.a_register ==0o2222
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldi(self) -> None:
-        # LDI 45
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2145)
-        self.storage.write_indirect_bank(0o45, 0o7654)
-        self.storage.unpack_instruction()
-        Instructions.LDI.determine_effective_address(self.storage)
-        assert Instructions.LDI.perform_logic(self.hardware) == 3
-        assert self.storage.s_register == 0o45
-        assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldm(self) -> None:
-        # LDM 137
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o2100)
-        self.storage.write_relative_bank(G_ADDRESS, 0o137)
-        self.storage.write_indirect_bank(0o137, 0o1370)
-        self.storage.unpack_instruction()
-        Instructions.LDM.determine_effective_address(self.storage)
-        assert Instructions.LDM.perform_logic(self.hardware) ==3
-        assert self.storage.s_register == 0o137
-        assert self.storage.z_register == 0o1370
-        assert self.storage.a_register == 0o1370
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-        assert self.storage.run_stop_status
-
-    def test_ldn(self) -> None:
-        # LDN 37
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0437)
-        self.storage.unpack_instruction()
-        Instructions.LDN.determine_effective_address(self.storage)
-        assert Instructions.LDN.perform_logic(self.hardware) == 1
-        self.storage.advance_to_next_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert self.storage.z_register == 0o37
-        assert self.storage.a_register == 0o37
-
-    def test_lds(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3200)
-        self.storage.unpack_instruction()
-        Instructions.LDS.determine_effective_address(self.storage)
-        assert Instructions.LDS.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o77
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpc(self) -> None:
-        assert Instructions.LPC.name() == "LPC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1200)
-        self.storage.write_relative_bank(G_ADDRESS, 0o77)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        Instructions.LPC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.LPC.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpd(self) -> None:
-        assert Instructions.LPD.name() == "LPD"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1040)
-        self.storage.write_direct_bank(0o40, 0o77)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        Instructions.LPD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o40
-        assert Instructions.LPD.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpf(self) -> None:
-        assert Instructions.LPF.name() == "LPF"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1201)
-        self.storage.write_relative_bank(G_ADDRESS, 0o77)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        Instructions.LPF.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.LPF.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpi(self) -> None:
-        assert Instructions.LPI.name() == "LPI"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1140)
-        self.storage.write_indirect_bank(0o40, 0o77)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        Instructions.LPI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o40
-        assert Instructions.LPI.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpm(self) -> None:
-        assert Instructions.LPM.name() == "LPM"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1100)
-        self.storage.write_relative_bank(G_ADDRESS, 0o140)
-        self.storage.write_relative_bank(0o140, 0o77)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        Instructions.LPM.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o140
-        assert Instructions.LPM.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lpn(self) -> None:
-        assert Instructions.LPN.name() == "LPN"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0277)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        Instructions.LPN.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.LPN.perform_logic(self.hardware) == 1
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_lps(self) -> None:
-        assert Instructions.LPS.name() == "LPS"
-        self.storage.write_specific(0o77)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1300)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        Instructions.LPS.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o7777
-        assert Instructions.LPS.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o21
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_ls1(self)-> None:
-        # LS1
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0x0102)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o4001
-        self.storage.a_register = 0o4001
-        Instructions.LS1.determine_effective_address(self.storage)
-        assert Instructions.LS1.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o4001
-        assert self.storage.a_register == 0o0003
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_ls2(self) -> None:
-        # LS2
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0103)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o6001
-        self.storage.a_register = 0o6001
-        Instructions.LS2.determine_effective_address(self.storage)
-        assert Instructions.LS2.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o6001
-        assert self.storage.a_register == 0o0007
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_ls3(self) -> None:
-        # LS3
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0110)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o7000
-        self.storage.a_register = 0o7000
-        Instructions.LS3.determine_effective_address(self.storage)
-        assert Instructions.LS3.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o7000
-        assert self.storage.a_register == 0o0007
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_ls6(self) -> None:
-        # LS6
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0111)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o3412
-        self.storage.z_to_a()
-        Instructions.LS6.determine_effective_address(self.storage)
-        assert Instructions.LS6.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o3412
-        assert self.storage.a_register == 0o1234
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        JPR.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o1000)
+        self.assertEqual(JPR.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.read_relative_bank(0o1000),
+                         INSTRUCTION_ADDRESS + 2)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.get_program_counter(), 0o1001)
+
+    def test_loads(self) -> None:
+        for (instruction, instruction_word, g_word, effective_address, bank,
+             operand, a_before, a_after, cycles, next_address) in _LOAD_CASES:
+            with self.subTest(instruction=instruction.name()):
+                self._reset_fixture()
+                storage = self.storage
+                _store_instruction(storage, instruction_word)
+                if g_word is not None:
+                    storage.write_relative_bank(G_ADDRESS, g_word)
+                if bank is not None:
+                    storage.write_absolute(bank, effective_address, operand)
+                storage.a_register = a_before
+                storage.unpack_instruction()
+                self.assertEqual(self.step(instruction), cycles)
+                self.assert_registers(
+                    s_register=effective_address, z_register=operand,
+                    a_register=a_after, p_register=next_address,
+                    run_stop_status=True, err_status=False)
+
+    def test_shifts(self) -> None:
+        for instruction, instruction_word, a_before, a_after in _SHIFT_CASES:
+            with self.subTest(instruction=instruction.name(), a=a_before):
+                self._reset_fixture()
+                storage = self.storage
+                _store_instruction(storage, instruction_word)
+                storage.unpack_instruction()
+                storage.z_register = a_before
+                storage.a_register = a_before
+                self.assertEqual(self.step(instruction), 1)
+                self.assert_registers(
+                    z_register=a_before, a_register=a_after,
+                    run_stop_status=True,
+                    p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_muh(self) -> None:
         # MUH
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0113)
+        _store_instruction(self.storage, 0o0113)
         self.storage.unpack_instruction()
         self.storage.a_register = 1
-        Instructions.MUH.determine_effective_address(self.storage) # Does nothing.
-        assert Instructions.MUH.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.a_register == 100
-        assert not self.storage.err_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.step(MUH), 1)
+        self.assertTrue(self.storage.run_stop_status)
+        self.assertEqual(self.storage.a_register, 100)
+        self.assertFalse(self.storage.err_status)
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_mut(self) -> None:
         # MUT
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0112)
+        _store_instruction(self.storage, 0o0112)
         self.storage.unpack_instruction()
         self.storage.a_register = 1
-        Instructions.MUT.determine_effective_address(self.storage) # Does nothing.
-        assert Instructions.MUT.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.a_register == 10
-        assert not self.storage.err_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_njb_a_minus_zero(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6402)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.NJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 2
-        Instructions.NJB.perform_logic(self.hardware)
-        assert (self.storage.next_address() ==
-                INSTRUCTION_ADDRESS - 2)
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                INSTRUCTION_ADDRESS - 2)
-
-    def test_njb_a_negative(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6402)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.NJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 2
-        Instructions.NJB.perform_logic(self.hardware)
-        assert (self.storage.next_address() ==
-                INSTRUCTION_ADDRESS - 2)
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                INSTRUCTION_ADDRESS - 2)
-
-    def test_njb_a_positive(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6402)
-        self.storage.a_register = 1
-        self.storage.unpack_instruction()
-        Instructions.NJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 2
-        Instructions.NJB.perform_logic(self.hardware)
-        assert (self.storage.next_address() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_njb_a_zero(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6402)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.NJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 2
-        Instructions.NJB.perform_logic(self.hardware)
-        assert (self.storage.next_address() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_njf_a_minus_zero(self) -> None:
-        # NJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6340)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.NJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_njf_a_negative(self) -> None:
-        # NJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6340)
-        self.storage.a_register = 0o7776
-        self.storage.unpack_instruction()
-        Instructions.NJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_njf_a_positive(self) -> None:
-        # NJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6340)
-        self.storage.a_register = 0o3777
-        self.storage.unpack_instruction()
-        Instructions.NJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_njf_a_zero(self) -> None:
-        # NJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6340)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.NJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_nzb_a_minus_zero(self) -> None:
-        # NZB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6540)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.NZB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.NZB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_nzb_a_negative(self) -> None:
-        # NZB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6540)
-        self.storage.a_register = 0o4000
-        self.storage.unpack_instruction()
-        Instructions.NZB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.NZB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_nzb_a_positive(self) -> None:
-        # NZB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6540)
-        self.storage.a_register = 0o3777
-        self.storage.unpack_instruction()
-        Instructions.NZB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.NZB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_nzb_a_zero(self) -> None:
-        # NZB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6540)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.NZB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.NZB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_nzf_a_minus_zero(self) -> None:
-        # NZF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6140)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.NZF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NZF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_nzf_a_negative(self) -> None:
-        # NZF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6140)
-        self.storage.a_register = 0o4000
-        self.storage.unpack_instruction()
-        Instructions.NZF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NZF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_nzf_a_positive(self) -> None:
-        # NZF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6140)
-        self.storage.a_register = 0o3777
-        self.storage.unpack_instruction()
-        Instructions.NZF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NZF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_nzf_a_zero(self) -> None:
-        # NZF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6140)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.NZF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.NZF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.step(MUT), 1)
+        self.assertTrue(self.storage.run_stop_status)
+        self.assertEqual(self.storage.a_register, 10)
+        self.assertFalse(self.storage.err_status)
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+
+    def test_conditional_jumps(self) -> None:
+        for (instruction, instruction_word, jump_address,
+             outcomes) in _CONDITIONAL_JUMP_CASES:
+            for a, taken in outcomes:
+                with self.subTest(
+                        instruction=instruction.name(), a=f"{a:04o}"):
+                    self._reset_fixture()
+                    storage = self.storage
+                    _store_instruction(storage, instruction_word)
+                    storage.a_register = a
+                    storage.unpack_instruction()
+                    instruction.determine_effective_address(storage)
+                    self.assertEqual(storage.s_register, jump_address)
+                    instruction.perform_logic(self.hardware)
+                    expected_address = (
+                        jump_address if taken
+                        else AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+                    self.assertEqual(storage.next_address(), expected_address)
+                    storage.advance_to_next_instruction()
+                    self.assertEqual(storage.p_register, expected_address)
 
     def test_nop(self) -> None:
         # NOP 1
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0001)
+        _store_instruction(self.storage, 0o0001)
         self.storage.z_register = 0o3333
         self.storage.a_register = 0o3333
-        Instructions.NOP.determine_effective_address(self.storage)
-        assert Instructions.NOP.perform_logic(self.hardware) == 1
-        assert self.storage.a_register == 0o3333
-        assert self.storage.z_register == 0o3333
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.step(NOP), 1)
+        self.assertEqual(self.storage.a_register, 0o3333)
+        self.assertEqual(self.storage.z_register, 0o3333)
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_ota(self) -> None:
         self.bi_tape.set_online_status(True)
@@ -1419,50 +895,51 @@ class Test(TestCase):
         # EXC 3700  Select the HyperLoopQuantumGravityBiTape
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7500)
+        _store_instruction(self.storage, 0o7500)
         self.storage.write_relative_bank(G_ADDRESS, 0o3700)
         self.storage.unpack_instruction()
-        Instructions.EXC.determine_effective_address(self.storage)
-        Instructions.EXC.perform_logic(self.hardware)
-        Instructions.EXC.post_process(self.hardware)
+        EXC.determine_effective_address(self.storage)
+        EXC.perform_logic(self.hardware)
+        EXC.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.LOCKED
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.LOCKED)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # CIL   Clear interrupt lockout
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0120)
+        _store_instruction(self.storage, 0o0120)
         self.storage.unpack_instruction()
-        Instructions.CIL.determine_effective_address(self.storage)
-        Instructions.CIL.perform_logic(self.hardware)
-        Instructions.CIL.post_process(self.hardware)
+        CIL.determine_effective_address(self.storage)
+        CIL.perform_logic(self.hardware)
+        CIL.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.UNLOCK_PENDING
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock,
+                         InterruptLock.UNLOCK_PENDING)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # OTA  Write the contents of the accumulator to the selected
         #      normal output device
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7677)
+        _store_instruction(self.storage, 0o7677)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o7070
-        Instructions.OTA.determine_effective_address(self.storage)
-        assert Instructions.OTA.perform_logic(self.hardware) == 4
-        assert self.storage.out_status
-        Instructions.OTA.post_process(self.hardware)
-        assert not self.storage.out_status
-        self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.FREE
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
-        assert self.bi_tape.output_data() == [0o7070]
+        OTA.determine_effective_address(self.storage)
+        self.assertEqual(OTA.perform_logic(self.hardware), 4)
+        self.assertTrue(self.storage.out_status)
+        OTA.post_process(self.hardware)
+        self.assertFalse(self.storage.out_status)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.FREE)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertEqual(self.bi_tape.output_data(), [0o7070])
 
     def test_otn(self) -> None:
         self.bi_tape.set_online_status(True)
@@ -1470,50 +947,51 @@ class Test(TestCase):
         # EXC 3700  Select the HyperLoopQuantumGravityBiTape
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7500)
+        _store_instruction(self.storage, 0o7500)
         self.storage.write_relative_bank(G_ADDRESS, 0o3700)
         self.storage.unpack_instruction()
-        Instructions.EXC.determine_effective_address(self.storage)
-        Instructions.EXC.perform_logic(self.hardware)
-        Instructions.EXC.post_process(self.hardware)
+        EXC.determine_effective_address(self.storage)
+        EXC.perform_logic(self.hardware)
+        EXC.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.LOCKED
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.LOCKED)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # CIL   Clear interrupt lockout
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0120)
+        _store_instruction(self.storage, 0o0120)
         self.storage.unpack_instruction()
-        Instructions.CIL.determine_effective_address(self.storage)
-        Instructions.CIL.perform_logic(self.hardware)
-        Instructions.CIL.post_process(self.hardware)
+        CIL.determine_effective_address(self.storage)
+        CIL.perform_logic(self.hardware)
+        CIL.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.UNLOCK_PENDING
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock,
+                         InterruptLock.UNLOCK_PENDING)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # OTN 47 Write the E (47, the low 6 bits of the instruction)
         #      to the selected normal output device
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7447)
+        _store_instruction(self.storage, 0o7447)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o7070
-        Instructions.OTN.determine_effective_address(self.storage)
-        assert Instructions.OTN.perform_logic(self.hardware) == 4
-        assert self.storage.out_status
-        Instructions.OTN.post_process(self.hardware)
-        assert not self.storage.out_status
-        self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.FREE
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
-        assert self.bi_tape.output_data() == [0o0047]
+        OTN.determine_effective_address(self.storage)
+        self.assertEqual(OTN.perform_logic(self.hardware), 4)
+        self.assertTrue(self.storage.out_status)
+        OTN.post_process(self.hardware)
+        self.assertFalse(self.storage.out_status)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.FREE)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertEqual(self.bi_tape.output_data(), [0o0047])
 
     def test_out(self) -> None:
         self.bi_tape.set_online_status(True)
@@ -1527,194 +1005,100 @@ class Test(TestCase):
         # EXC 3700  Select the HyperLoopQuantumGravityBiTape
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7500)
+        _store_instruction(self.storage, 0o7500)
         self.storage.write_relative_bank(G_ADDRESS, 0o3700)
         self.storage.unpack_instruction()
-        Instructions.EXC.determine_effective_address(self.storage)
-        Instructions.EXC.perform_logic(self.hardware)
-        Instructions.EXC.post_process(self.hardware)
+        EXC.determine_effective_address(self.storage)
+        EXC.perform_logic(self.hardware)
+        EXC.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.LOCKED
-        assert (self.storage.get_program_counter() == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.LOCKED)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # CIL   Clear interrupt lockout
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0120)
+        _store_instruction(self.storage, 0o0120)
         self.storage.unpack_instruction()
-        Instructions.CIL.determine_effective_address(self.storage)
-        Instructions.CIL.perform_logic(self.hardware)
-        Instructions.CIL.post_process(self.hardware)
+        CIL.determine_effective_address(self.storage)
+        CIL.perform_logic(self.hardware)
+        CIL.post_process(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.UNLOCK_PENDING
-        assert (self.storage.get_program_counter() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
+        self.assertEqual(self.storage.interrupt_lock,
+                         InterruptLock.UNLOCK_PENDING)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
 
         # OUT 4 1246  Write from the indirect memory bank,
         #             starting from ([P] + 4)(i) and ending
         #             at 1245 (1246 is the LWA + 1)
         self.storage.service_pending_interrupts()
         self.storage.p_register = INSTRUCTION_ADDRESS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7204)
+        _store_instruction(self.storage, 0o7204)
         self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS + 10)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 4, READ_AND_WRITE_ADDRESS)
         self.storage.unpack_instruction()
-        Instructions.OUT.determine_effective_address(self.storage)
-        assert Instructions.OUT.perform_logic(self.hardware) == 40
-        assert self.storage.out_status
-        Instructions.OUT.post_process(self.hardware)
-        assert not self.storage.out_status
-        self.storage.advance_to_next_instruction()
-        assert self.storage.interrupt_lock == InterruptLock.FREE
-        assert (self.storage.get_program_counter() == AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-        assert not self.storage.machine_hung
-        assert self.bi_tape.output_data() == _BI_TAPE_INPUT_DATA
-
-    def test_pjf_a_minus_zero(self) -> None:
-        # PJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.PJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.PJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_pjb_a_minus_zero(self) -> None:
-        # PJB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.PJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.PJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_pjb_a_negative(self) -> None:
-        # PJB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0o7776
-        self.storage.unpack_instruction()
-        Instructions.PJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.PJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_pjb_a_positive(self) -> None:
-        # PJB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 1
-        self.storage.unpack_instruction()
-        Instructions.PJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.PJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_pjb_a_zero(self) -> None:
-        # PJB
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.PJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.PJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_pjf_a_negative(self) -> None:
-        # PJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0o7776
-        self.storage.unpack_instruction()
-        Instructions.PJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.PJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        OUT.determine_effective_address(self.storage)
+        self.assertEqual(OUT.perform_logic(self.hardware), 40)
+        self.assertTrue(self.storage.out_status)
+        OUT.post_process(self.hardware)
+        self.assertFalse(self.storage.out_status)
         self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_pjf_a_positive(self) -> None:
-        # PJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 1
-        self.storage.unpack_instruction()
-        Instructions.PJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.PJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
-
-    def test_pjf_a_zero(self) -> None:
-        assert Instructions.PJF.name() == "PJF"
-        # PJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6240)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.PJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.PJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
+        self.assertEqual(self.storage.interrupt_lock, InterruptLock.FREE)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertFalse(self.storage.machine_hung)
+        self.assertEqual(self.bi_tape.output_data(), _BI_TAPE_INPUT_DATA)
 
     def test_pta(self) -> None:
-        assert Instructions.PTA.name() == "PTA"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0101)
+        _store_instruction(self.storage, 0o0101)
         self.storage.unpack_instruction()
-        Instructions.PTA.perform_logic(self.hardware)
-        assert self.storage.a_register == INSTRUCTION_ADDRESS
+        PTA.perform_logic(self.hardware)
+        self.assertEqual(self.storage.a_register, INSTRUCTION_ADDRESS)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.p_register ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_rab(self) -> None:
         address = INSTRUCTION_ADDRESS - 2
         self.storage.write_relative_bank(address, 0o777)
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5302)
+        _store_instruction(self.storage, 0o5302)
         self.storage.unpack_instruction()
-        Instructions.RAB.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAB.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_relative_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAB.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAB.perform_logic(self.hardware), 3)
+        self.assertEqual(
+                self.storage.read_relative_bank(self.storage.s_register),
+                0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_rac(self) -> None:
         address = G_ADDRESS
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5200)
+        _store_instruction(self.storage, 0o5200)
         self.storage.write_relative_bank(address, 0o777)
         self.storage.unpack_instruction()
-        Instructions.RAC.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAC.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_relative_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAC.perform_logic(self.hardware), 3)
+        self.assertEqual(
+                self.storage.read_relative_bank(self.storage.s_register),
+                0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_rad(self) -> None:
         address = 0o20
@@ -1722,57 +1106,55 @@ class Test(TestCase):
         self.storage.write_direct_bank(self.storage.s_register, 0o777)
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5020)
+        _store_instruction(self.storage, 0o5020)
         self.storage.unpack_instruction()
-        Instructions.RAD.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAD.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_direct_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAD.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAD.perform_logic(self.hardware), 3)
+        self.assertEqual(
+                self.storage.read_direct_bank(self.storage.s_register),
+                0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_raf(self) -> None:
         address = INSTRUCTION_ADDRESS + 0o10
         self.storage.write_relative_bank(address, 0o777)
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5210)
+        _store_instruction(self.storage, 0o5210)
         self.storage.unpack_instruction()
-        Instructions.RAF.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAF.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_relative_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAF.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAF.perform_logic(self.hardware), 3)
+        self.assertEqual(
+                self.storage.read_relative_bank(self.storage.s_register),
+                0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_ras(self) -> None:
         address = 0o7777
         self.storage.write_specific(0o777)
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5300)
+        _store_instruction(self.storage, 0o5300)
         self.storage.unpack_instruction()
-        Instructions.RAS.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAS.perform_logic(self.hardware) == 3
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_specific() == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAS.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.read_specific(), 0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_rai(self) -> None:
         address = 0o20
@@ -1780,813 +1162,600 @@ class Test(TestCase):
         self.storage.write_indirect_bank(self.storage.s_register, 0o777)
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5020)
+        _store_instruction(self.storage, 0o5020)
         self.storage.unpack_instruction()
-        Instructions.RAI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o20
-        assert Instructions.RAI.perform_logic(self.hardware) == 4
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_indirect_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
+        RAI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o20)
+        self.assertEqual(RAI.perform_logic(self.hardware), 4)
+        self.assertEqual(
+                self.storage.read_indirect_bank(self.storage.s_register),
+                0o1000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_ram(self) -> None:
         address = 0o200
         self.storage.a_register = 0o1
         self.storage.run_stop_status = True
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o5100)
+        _store_instruction(self.storage, 0o5100)
         self.storage.write_relative_bank(G_ADDRESS, address)
         self.storage.write_relative_bank(address, 0o777)
         self.storage.unpack_instruction()
-        Instructions.RAM.determine_effective_address(self.storage)
-        assert self.storage.s_register == address
-        assert Instructions.RAM.perform_logic(self.hardware) == 4
-        assert self.storage.run_stop_status
-        assert not self.storage.err_status
-        assert self.storage.s_register == address
-        assert self.storage.read_relative_bank(self.storage.s_register) == 0o1000
-        assert self.storage.a_register == 0o1000
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_rs1(self) -> None:
-        # RS1
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0114)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o4020
-        self.storage.a_register = 0o4020
-        Instructions.RS1.determine_effective_address(self.storage)
-        assert Instructions.RS1.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o4020
-        assert self.storage.a_register == 0o6010
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_rs2(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0115)
-        self.storage.unpack_instruction()
-        self.storage.z_register = 0o0007
-        self.storage.z_to_a()
-        Instructions.RS2.determine_effective_address(self.storage)
-        assert Instructions.RS2.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o0007
-        assert self.storage.a_register == 0o0001
-        self.storage.z_register = 0o4007
-        self.storage.z_to_a()
-        assert Instructions.RS2.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
-        assert self.storage.z_register == 0o4007
-        assert self.storage.a_register == 0o7001
+        RAM.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, address)
+        self.assertEqual(RAM.perform_logic(self.hardware), 4)
+        self.assertEqual(
+                self.storage.read_relative_bank(self.storage.s_register),
+                0o1000)
+        self.storage.advance_to_next_instruction()
+        self.assert_registers(
+            a_register=0o1000, s_register=address,
+            p_register=AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS,
+            run_stop_status=True, err_status=False)
 
     def test_sbu(self) -> None:
-        assert Instructions.SBU.name() == "SBU"
         self.storage.a_register = 0o200
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0146)
+        _store_instruction(self.storage, 0o0146)
         self.storage.unpack_instruction()
-        Instructions.SBU.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        assert Instructions.SBU.perform_logic(self.hardware) == 1
-        assert self.storage.buffer_storage_bank == 0o06
+        SBU.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        self.assertEqual(SBU.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.buffer_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_scb(self) -> None:
-        assert Instructions.SCB.name() == "SCB"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1702)
+        _store_instruction(self.storage, 0o1702)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 0o02, 0o14)
         self.storage.a_register = 0o12
-        Instructions.SCB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o02
-        assert Instructions.SCB.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
+        SCB.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS - 0o02)
+        self.assertEqual(SCB.perform_logic(self.hardware), 2)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scc(self) -> None:
-        assert Instructions.SCC.name() == "SCC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1600)
+        _store_instruction(self.storage, 0o1600)
         self.storage.write_relative_bank(G_ADDRESS, 0o14)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o12
-        Instructions.SCC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SCC.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
-        assert not self.storage.err_status
+        SCC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SCC.perform_logic(self.hardware), 2)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scd(self) -> None:
-        assert Instructions.SCD.name() == "SCD"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1424)
+        _store_instruction(self.storage, 0o1424)
         self.storage.unpack_instruction()
         self.storage.write_direct_bank(0o24, 0o14)
         self.storage.a_register = 0o12
-        Instructions.SCD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o24
-        assert Instructions.SCD.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
-        assert not self.storage.err_status
+        SCD.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o24)
+        self.assertEqual(SCD.perform_logic(self.hardware), 2)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scf(self) -> None:
-        assert Instructions.SCF.name() == "SCF"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1624)
+        _store_instruction(self.storage, 0o1624)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 0o24, 0o14)
         self.storage.a_register = 0o12
         self.storage.unpack_instruction()
-        Instructions.SCF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o24
-        assert Instructions.SCF.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o006
-        assert not self.storage.err_status
+        SCF.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS + 0o24)
+        self.assertEqual(SCF.perform_logic(self.hardware), 2)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_sci(self) -> None:
-        assert Instructions.SCI.name() == "SCI"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1524)
+        _store_instruction(self.storage, 0o1524)
         self.storage.unpack_instruction()
         self.storage.write_indirect_bank(0o24, 0o14)
         self.storage.a_register = 0o12
-        Instructions.SCI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o24
-        assert Instructions.SCI.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
-        assert not self.storage.err_status
+        SCI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o24)
+        self.assertEqual(SCI.perform_logic(self.hardware), 3)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scm(self) -> None:
-        assert Instructions.SCM.name() == "SCM"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o1500)
+        _store_instruction(self.storage, 0o1500)
         self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(READ_AND_WRITE_ADDRESS, 0o14)
         self.storage.a_register = 0o12
-        Instructions.SCM.determine_effective_address(self.storage)
-        assert self.storage.s_register == READ_AND_WRITE_ADDRESS
-        Instructions.SCM.perform_logic(self.hardware)
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
-        assert not self.storage.err_status
+        SCM.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, READ_AND_WRITE_ADDRESS)
+        SCM.perform_logic(self.hardware)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scn(self) -> None:
-        assert Instructions.SCN.name() == "SCN"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0314)
+        _store_instruction(self.storage, 0o0314)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o12
-        Instructions.SCN.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        assert Instructions.SCN.perform_logic(self.hardware) == 1
-        assert not self.storage.err_status
-        assert self.storage.a_register == 0o6
+        SCN.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        self.assertEqual(SCN.perform_logic(self.hardware), 1)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assert_registers(
+            a_register=0o06,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_scs(self) -> None:
-        assert Instructions.SCS.name() == "SCS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o14)
+        _store_instruction(self.storage, 0o14)
         self.storage.write_specific(0o14)
         self.storage.a_register = 0o12
-        Instructions.SCS.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        assert Instructions.SCS.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o06
-        assert not self.storage.err_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_sdb(self) -> None:
-        # STB 15
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4315)
-        self.storage.a_register = 0o0210
-        self.storage.unpack_instruction()
-        Instructions.STB.determine_effective_address(self.storage)
-        assert Instructions.STB.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o0210
-        assert self.storage.read_relative_bank(
-            INSTRUCTION_ADDRESS - 0o15) == 0o0210
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        SCS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        self.assertEqual(SCS.perform_logic(self.hardware), 2)
+        self.storage.advance_to_next_instruction()
+        self.assert_registers(
+            a_register=0o06, z_register=0o14,
+            p_register=AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS,
+            err_status=False)
 
     def test_sdc(self) -> None:
-        assert Instructions.SDC.name() == "SDC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0046)
+        _store_instruction(self.storage, 0o0046)
         self.storage.unpack_instruction()
-        Instructions.SDC.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.SDC.perform_logic(self.hardware) == 1
-        assert self.storage.direct_storage_bank == 0o06
+        SDC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(SDC.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.direct_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sic(self) -> None:
-        assert Instructions.SIC.name() == "SIC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o26)
+        _store_instruction(self.storage, 0o26)
         self.storage.unpack_instruction()
-        Instructions.SIC.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.SIC.perform_logic(self.hardware) == 1
-        assert self.storage.indirect_storage_bank == 0o06
+        SIC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(SIC.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.indirect_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sid(self) -> None:
-        assert Instructions.SID.name() == "SID"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o66)
+        _store_instruction(self.storage, 0o66)
         self.storage.unpack_instruction()
-        Instructions.SID.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.SID.perform_logic(self.hardware) == 1
-        assert self.storage.direct_storage_bank == 0o06
-        assert self.storage.indirect_storage_bank == 0o06
+        SID.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(SID.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.direct_storage_bank, 0o06)
+        self.assertEqual(self.storage.indirect_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sjs_halt_and_branch(self) -> None:
-        assert Instructions.SJS.name() == "SJS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7712)
+        _store_instruction(self.storage, 0o7712)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o3)
         self.storage.set_stop_switch_mask(0o6)
-        Instructions.SJS.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SJS.perform_logic(self.hardware) == 2
-        assert not self.storage.run_stop_status
+        SJS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SJS.perform_logic(self.hardware), 2)
+        self.assertFalse(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_sls_halt_and_no_branch(self) -> None:
-        assert Instructions.SJS.name() == "SJS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7712)
+        _store_instruction(self.storage, 0o7712)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o6)
         self.storage.set_stop_switch_mask(0o6)
-        Instructions.SJS.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SJS.perform_logic(self.hardware) == 1
-        assert not self.storage.run_stop_status
+        SJS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SJS.perform_logic(self.hardware), 1)
+        self.assertFalse(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sls_no_halt_and_branch(self):
-        assert Instructions.SJS.name() == "SJS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7712)
+        _store_instruction(self.storage, 0o7712)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o3)
         self.storage.set_stop_switch_mask(0o5)
-        Instructions.SJS.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SJS.perform_logic(self.hardware) == 2
-        assert self.storage.run_stop_status
+        SJS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SJS.perform_logic(self.hardware), 2)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_sls_no_halt_no_branch(self) -> None:
-        assert Instructions.SJS.name() == "SJS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7712)
+        _store_instruction(self.storage, 0o7712)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o6)
         self.storage.set_stop_switch_mask(0o5)
-        Instructions.SJS.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SJS.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
+        SJS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SJS.perform_logic(self.hardware), 1)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_slj_branch(self) -> None:
-        assert Instructions.SLJ.name() == "SLJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7760)
+        _store_instruction(self.storage, 0o7760)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o5)
-        Instructions.SLJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SLJ.perform_logic(self.hardware) == 2
+        SLJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SLJ.perform_logic(self.hardware), 2)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_slj_no_branch(self) -> None:
-        assert Instructions.SLJ.name() == "SLJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7760)
+        _store_instruction(self.storage, 0o7760)
         self.storage.unpack_instruction()
         self.storage.write_relative_bank(G_ADDRESS, 0o200)
         self.storage.set_jump_switch_mask(0o1)
-        Instructions.SLJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SLJ.perform_logic(self.hardware) == 1
+        SLJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SLJ.perform_logic(self.hardware), 1)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sls_halt(self) -> None:
-        assert Instructions.SLS.name() == "SLS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7702)
+        _store_instruction(self.storage, 0o7702)
         self.storage.unpack_instruction()
         self.storage.set_stop_switch_mask(0o6)
-        Instructions.SLJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SLS.perform_logic(self.hardware) == 1
-        assert not self.storage.run_stop_status
+        SLJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SLS.perform_logic(self.hardware), 1)
+        self.assertFalse(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sls_no_halt(self) -> None:
-        assert Instructions.SLS.name() == "SLS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o7702)
+        _store_instruction(self.storage, 0o7702)
         self.storage.unpack_instruction()
         self.storage.set_stop_switch_mask(0o5)
-        Instructions.SLJ.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SLS.perform_logic(self.hardware) == 1
-        assert self.storage.run_stop_status
+        SLJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SLS.perform_logic(self.hardware), 1)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_srj(self) -> None:
-        assert Instructions.SRJ.name() == "SRJ"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0016)
+        _store_instruction(self.storage, 0o0016)
         self.storage.unpack_instruction()
         self.storage.a_register = 0o200
-        Instructions.SRJ.determine_effective_address(self.storage)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS
-        assert Instructions.SRJ.perform_logic(self.hardware) == 1
-        assert self.storage.relative_storage_bank == 0o06
+        SRJ.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.get_program_counter(),
+                         INSTRUCTION_ADDRESS)
+        self.assertEqual(SRJ.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.relative_storage_bank, 0o06)
         self.storage.advance_to_next_instruction()
-        assert self.storage.get_program_counter() == 0o200
-
-    def test_sdd(self) -> None:
-        # STD 15
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4015)
-        self.storage.a_register = 0o0210
-        self.storage.unpack_instruction()
-        Instructions.STD.determine_effective_address(self.storage)
-        assert Instructions.STD.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o0210
-        assert self.storage.read_direct_bank(0o15) == 0o0210
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(), 0o200)
 
     def test_sbb(self) -> None:
-        assert Instructions.SBB.name() == "SBB"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3703)
+        _store_instruction(self.storage, 0o3703)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 3, 0o77)
         self.storage.a_register = 0o4420
         self.storage.unpack_instruction()
-        Instructions.SBB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 3
-        assert Instructions.SBB.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o4321
+        SBB.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS - 3)
+        self.assertEqual(SBB.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.z_register, 0o77)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbc(self) -> None:
-        assert Instructions.SBC.name() == "SBC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3600)
+        _store_instruction(self.storage, 0o3600)
         self.storage.a_register = 0o5555
         self.storage.write_relative_bank(G_ADDRESS, 0o1234)
         self.storage.unpack_instruction()
-        Instructions.SBC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SBC.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o1234
-        assert self.storage.a_register -- 0o4321
+        SBC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SBC.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.z_register, 0o1234)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbd(self) -> None:
-        assert Instructions.SBD.name() == "SBD"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3440)
+        _store_instruction(self.storage, 0o3440)
         self.storage.write_direct_bank(0o40, 0o14)
         self.storage.a_register = 0o4335
         self.storage.unpack_instruction()
-        Instructions.SBD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o40
-        assert Instructions.SBD.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o14
-        assert self.storage.a_register == 0o4321
+        SBD.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o40)
+        self.assertEqual(SBD.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.z_register, 0o14)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
+        self.assertEqual(self.storage.p_register,
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbf(self) -> None:
-        assert Instructions.SBF.name() == "SBF"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3603)
+        _store_instruction(self.storage, 0o3603)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 3, 0o1234)
         self.storage.a_register = 0o5555
         self.storage.unpack_instruction()
-        Instructions.SBF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 3
-        assert Instructions.SBF.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o1234
-        assert self.storage.a_register == 0o4321
+        SBF.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS + 3)
+        self.assertEqual(SBF.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.z_register, 0o1234)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbi(self) -> None:
-        assert Instructions.SBI.name() == "SBI"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3510)
+        _store_instruction(self.storage, 0o3510)
         self.storage.write_indirect_bank(0o10, 0o13)
         self.storage.a_register = 0o4334
         self.storage.unpack_instruction()
-        Instructions.SBI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o10
-        assert Instructions.SBI.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o13
-        assert self.storage.a_register == 0o4321
+        SBI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o10)
+        self.assertEqual(SBI.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.z_register, 0o13)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_srb(self) -> None:
-        assert Instructions.SRB.name() == "SRB"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4702)
+        _store_instruction(self.storage, 0o4702)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS - 2, 0o4001)
         self.storage.unpack_instruction()
-        Instructions.SRB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 2
-        assert Instructions.SRB.perform_logic(self.hardware) == 3
-        assert self.storage.storage_cycle == MCS_MODE_REL
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_relative_bank(
-            INSTRUCTION_ADDRESS - 2) == 0o0003
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        SRB.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS - 2)
+        self.assertEqual(SRB.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_REL)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(
+                self.storage.read_relative_bank(INSTRUCTION_ADDRESS - 2),
+                0o0003)
+        self.assertFalse(self.storage.err_status)
+        self.assertTrue(self.storage.run_stop_status)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_src(self) -> None:
-        assert Instructions.SRC.name() == "SRC"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4600)
+        _store_instruction(self.storage, 0o4600)
         self.storage.write_relative_bank(G_ADDRESS, 0o4001)
         self.storage.unpack_instruction()
-        Instructions.SRC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.SRC.perform_logic(self.hardware) == 3
-        assert self.storage.storage_cycle == MCS_MODE_REL
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_relative_bank(G_ADDRESS) == 0o0003
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
+        SRC.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, G_ADDRESS)
+        self.assertEqual(SRC.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_REL)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(self.storage.read_relative_bank(G_ADDRESS), 0o0003)
+        self.assertFalse(self.storage.err_status)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_srd(self) -> None:
-        assert Instructions.SRD.name() == "SRD"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4430)
+        _store_instruction(self.storage, 0o4430)
         self.storage.write_direct_bank(0o30, 0o4001)
         self.storage.unpack_instruction()
-        Instructions.SRD.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o30
-        assert Instructions.SRD.perform_logic(self.hardware) == 3
-        assert self.storage.storage_cycle == MCS_MODE_DIR
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_direct_bank(0o30) == 0o0003
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
+        SRD.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o30)
+        self.assertEqual(SRD.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_DIR)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(self.storage.read_direct_bank(0o30), 0o0003)
+        self.assertFalse(self.storage.err_status)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_srf(self) -> None:
-        assert Instructions.SRF.name() == "SRF"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4602)
+        _store_instruction(self.storage, 0o4602)
         self.storage.write_relative_bank(INSTRUCTION_ADDRESS + 2, 0o4001)
         self.storage.unpack_instruction()
-        Instructions.SRF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 2
-        assert Instructions.SRF.perform_logic(self.hardware) == 3
-        assert self.storage.storage_cycle == MCS_MODE_REL
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_relative_bank(
-            INSTRUCTION_ADDRESS + 2) == 0o0003
+        SRF.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS + 2)
+        self.assertEqual(SRF.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_REL)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(
+                self.storage.read_relative_bank(INSTRUCTION_ADDRESS + 2),
+                0o0003)
 
     def test_sri(self) -> None:
-        assert Instructions.SRI.name() == "SRI"
         self.storage.write_indirect_bank(0o14, 0o4001)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4514)
+        _store_instruction(self.storage, 0o4514)
         self.storage.unpack_instruction()
-        Instructions.SRI.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o14
-        assert Instructions.SRI.perform_logic(self.hardware) == 4
-        assert self.storage.storage_cycle == MCS_MODE_IND
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_indirect_bank(0o14) == 0o0003
-        assert not self.storage.err_status
-        assert self.storage.run_stop_status
+        SRI.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o14)
+        self.assertEqual(SRI.perform_logic(self.hardware), 4)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_IND)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(self.storage.read_indirect_bank(0o14), 0o0003)
+        self.assertFalse(self.storage.err_status)
+        self.assertTrue(self.storage.run_stop_status)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_srm(self) -> None:
-        assert Instructions.SRM.name() == "SRM"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4500)
+        _store_instruction(self.storage, 0o4500)
         self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
         self.storage.write_relative_bank(READ_AND_WRITE_ADDRESS, 0o4001)
         self.storage.unpack_instruction()
-        Instructions.SRM.determine_effective_address(self.storage)
-        assert self.storage.s_register == READ_AND_WRITE_ADDRESS
-        assert Instructions.SRM.perform_logic(self.hardware) == 4
-        assert self.storage.storage_cycle == MCS_MODE_REL
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_relative_bank(
-            READ_AND_WRITE_ADDRESS) == 0o0003
+        SRM.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, READ_AND_WRITE_ADDRESS)
+        self.assertEqual(SRM.perform_logic(self.hardware), 4)
+        self.assertEqual(self.storage.storage_cycle, MCS_MODE_REL)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(
+                self.storage.read_relative_bank(READ_AND_WRITE_ADDRESS),
+                0o0003)
 
     def test_srs(self) -> None:
-        assert Instructions.SRS.name() == "SRS"
         self.storage.write_specific(0o4001)
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4000)
+        _store_instruction(self.storage, 0o4000)
         self.storage.unpack_instruction()
-        Instructions.SRS.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o7777
-        assert Instructions.SRS.perform_logic(self.hardware) == 3
-        assert self.storage.a_register == 0o0003
-        assert self.storage.z_register == 0o0003
-        assert self.storage.read_specific() == 0o0003
+        SRS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o7777)
+        self.assertEqual(SRS.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.a_register, 0o0003)
+        self.assertEqual(self.storage.z_register, 0o0003)
+        self.assertEqual(self.storage.read_specific(), 0o0003)
 
     def test_sbm(self) -> None:
-        assert Instructions.SBM.name() == "SBM"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3500)
+        _store_instruction(self.storage, 0o3500)
         self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
         self.storage.write_relative_bank(READ_AND_WRITE_ADDRESS, 0o241)
         self.storage.a_register = 0o4562
         self.storage.unpack_instruction()
-        Instructions.SBM.determine_effective_address(self.storage)
-        assert self.storage.s_register == READ_AND_WRITE_ADDRESS
-        assert Instructions.SBM.perform_logic(self.hardware) == 3
-        assert self.storage.z_register == 0o241
-        assert self.storage.a_register == 0o4321
+        SBM.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, READ_AND_WRITE_ADDRESS)
+        self.assertEqual(SBM.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.z_register, 0o241)
+        self.assertEqual(self.storage.a_register, 0o4321)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbn(self) -> None:
         # SBN 40
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0740)
+        _store_instruction(self.storage, 0o0740)
         self.storage.a_register = 0o1274
         self.storage.unpack_instruction()
-        Instructions.SBN.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.SBN.perform_logic(self.hardware) == 1
-        assert self.storage.z_register == 0o40
-        assert self.storage.a_register == 0o1234
+        SBN.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(SBN.perform_logic(self.hardware), 1)
+        self.assertEqual(self.storage.z_register, 0o40)
+        self.assertEqual(self.storage.a_register, 0o1234)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_sbs(self) -> None:
-        assert Instructions.SBS.name() == "SBS"
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o3700)
+        _store_instruction(self.storage, 0o3700)
         self.storage.a_register = 0o4420
         self.storage.unpack_instruction()
-        Instructions.SBS.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o7777
-        assert Instructions.SBS.perform_logic(self.hardware) == 2
-        assert self.storage.z_register == 0o77
-        assert self.storage.a_register == 0o4321
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_stc(self) -> None:
-        # STC 1234
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4200)
-        self.storage.write_relative_bank(G_ADDRESS, 0o1234)
-        self.storage.a_register = 0o4321
-        self.storage.unpack_instruction()
-        Instructions.STC.determine_effective_address(self.storage)
-        assert self.storage.s_register == G_ADDRESS
-        assert Instructions.STC.perform_logic(self.hardware) == 3
-        self.storage.advance_to_next_instruction()
-        assert self.storage.z_register == 0o4321
-        assert self.storage.read_relative_bank(G_ADDRESS) == 0o4321
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        SBS.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, 0o7777)
+        self.assertEqual(SBS.perform_logic(self.hardware), 2)
+        self.assertEqual(self.storage.z_register, 0o77)
+        self.assertEqual(self.storage.a_register, 0o4321)
+        self.storage.advance_to_next_instruction()
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
+
+    def test_store_a(self) -> None:
+        for (instruction, instruction_word, g_word, effective_address,
+             bank, cycles, next_address) in _STORE_A_CASES:
+            with self.subTest(instruction=instruction.name()):
+                self._reset_fixture()
+                storage = self.storage
+                _store_instruction(storage, instruction_word)
+                if g_word is not None:
+                    storage.write_relative_bank(G_ADDRESS, g_word)
+                storage.a_register = 0o4321
+                storage.unpack_instruction()
+                self.assertEqual(self.step(instruction), cycles)
+                self.assertEqual(
+                        storage.read_absolute(bank, effective_address),
+                        0o4321)
+                self.assert_registers(
+                    s_register=effective_address, z_register=0o4321,
+                    p_register=next_address)
 
     def test_ste(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0163)
+        _store_instruction(self.storage, 0o0163)
         self.storage.a_register = 0o5000
         self.storage.buffer_entrance_register = 0o300
         self.storage.unpack_instruction()
-        Instructions.STE.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        assert Instructions.STE.perform_logic(self.hardware) == 3
-        assert self.storage.read_direct_bank(0o63) == 0o300
-        assert self.storage.buffer_entrance_register == 0o5000
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_stf(self) -> None:
-        assert Instructions.STF.name() == "STF"
-        # STF 10
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4210)
-        self.storage.a_register = 0o0210
-        self.storage.unpack_instruction()
-        Instructions.STF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o10
-        Instructions.STF.perform_logic(self.hardware)
-        self.storage.advance_to_next_instruction()
-        assert self.storage.z_register == 0o0210
-        assert (self.storage.read_relative_bank(INSTRUCTION_ADDRESS + 0o10) ==
-                0o0210)
-        assert self.storage.get_program_counter() == INSTRUCTION_ADDRESS + 1
-
-    def test_sti(self) -> None:
-        assert Instructions.STI.name() == "STI"
-        # STI 14
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4114)
-        self.storage.a_register = 0o0210
-        self.storage.unpack_instruction()
-        Instructions.STI.determine_effective_address(self.storage)
-        assert Instructions.STI.perform_logic(self.hardware) == 4
-        assert self.storage.z_register == 0o0210
-        assert self.storage.read_indirect_bank(0o14) == 0o0210
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_stm(self) -> None:
-        assert Instructions.STM.name() == "STM"
-        # STM 1234
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4100)
-        self.storage.write_relative_bank(G_ADDRESS, READ_AND_WRITE_ADDRESS)
-        self.storage.a_register = 0o1234
-        self.storage.unpack_instruction()
-        Instructions.STM.determine_effective_address(self.storage)
-        assert self.storage.s_register == READ_AND_WRITE_ADDRESS
-        assert Instructions.STM.perform_logic(self.hardware) == 4
-        assert self.storage.z_register == 0o1234
-        assert self.storage.read_relative_bank(READ_AND_WRITE_ADDRESS) == 0o1234
+        STE.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        self.assertEqual(STE.perform_logic(self.hardware), 3)
+        self.assertEqual(self.storage.read_direct_bank(0o63), 0o300)
+        self.assertEqual(self.storage.buffer_entrance_register, 0o5000)
         self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_DOUBLE_WORD_INSTRUCTION_ADDRESS)
+        self.assertEqual(self.storage.get_program_counter(),
+                         AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
 
     def test_stp(self) -> None:
-        assert Instructions.STP.name() == "STP"
         # STP
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o0155)
-        self.storage.unpack_instruction()
-        Instructions.STP.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS
-        Instructions.STP.perform_logic(self.hardware)
-        assert self.storage.read_direct_bank(0o55) == INSTRUCTION_ADDRESS
-
-    def test_sts(self) -> None:
-        # STS
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o4300)
-        self.storage.a_register = 0o1234
-        self.storage.unpack_instruction()
-        Instructions.STS.determine_effective_address(self.storage)
-        assert self.storage.s_register == 0o7777
-        assert Instructions.STS.perform_logic(self.hardware)
-        assert self.storage.z_register == 0o1234
-        assert self.storage.read_specific() == 0o1234
-        self.storage.advance_to_next_instruction()
-        assert (self.storage.get_program_counter() ==
-                AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS)
-
-    def test_zjb_a_minus_zero(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6440)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.ZJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.ZJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjb_a_negative(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6440)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.ZJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.ZJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjb_a_positive(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6440)
-        self.storage.a_register = 1
-        self.storage.unpack_instruction()
-        Instructions.ZJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.ZJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjb_a_zero(self) -> None:
-        # ZJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6440)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.ZJB.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS - 0o0040
-        Instructions.ZJB.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS - 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS - 0o0040
-
-    def test_zjf_a_minus_zero(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6040)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.ZJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.ZJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjf_a_negative(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6040)
-        self.storage.a_register = 0o7777
-        self.storage.unpack_instruction()
-        Instructions.ZJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.ZJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjf_a_positive(self) -> None:
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6040)
-        self.storage.a_register = 1
-        self.storage.unpack_instruction()
-        Instructions.ZJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.ZJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == AFTER_SINGLE_WORD_INSTRUCTION_ADDRESS
-
-    def test_zjf_a_zero(self) -> None:
-        # ZJF
-        self.storage.write_relative_bank(INSTRUCTION_ADDRESS, 0o6040)
-        self.storage.a_register = 0
-        self.storage.unpack_instruction()
-        Instructions.ZJF.determine_effective_address(self.storage)
-        assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o0040
-        Instructions.ZJF.perform_logic(self.hardware)
-        assert self.storage.next_address() == INSTRUCTION_ADDRESS + 0o0040
-        self.storage.advance_to_next_instruction()
-        assert self.storage.p_register == INSTRUCTION_ADDRESS + 0o0040
+        _store_instruction(self.storage, 0o0155)
+        self.storage.unpack_instruction()
+        STP.determine_effective_address(self.storage)
+        self.assertEqual(self.storage.s_register, INSTRUCTION_ADDRESS)
+        STP.perform_logic(self.hardware)
+        self.assertEqual(self.storage.read_direct_bank(0o55),
+                         INSTRUCTION_ADDRESS)
+
+    def test_instruction_names(self) -> None:
+        for name, value in vars(Instructions).items():
+            if isinstance(value, Instructions.BaseInstruction):
+                with self.subTest(name=name):
+                    self.assertEqual(value.name(), name)
+
+    def test_instruction_trace(self) -> None:
+        storage = self.storage
+        storage.relative_bank_view()[
+            INSTRUCTION_ADDRESS:INSTRUCTION_ADDRESS + len(_TRACE_PROGRAM)] = (
+            _TRACE_PROGRAM)
+        for step, (p_offset, a) in enumerate(_TRACE_STATES):
+            with self.subTest(step=step):
+                storage.unpack_instruction()
+                self.step(decode(storage.f_instruction, storage.f_e))
+                self.assert_registers(
+                    p_register=INSTRUCTION_ADDRESS + p_offset, a_register=a,
+                    run_stop_status=True, err_status=False)
+        self.assertEqual(storage.read_direct_bank(0o20), 0o17)
+        self.assertEqual(
+                storage.read_relative_bank(INSTRUCTION_ADDRESS + 0o17),
+                0o20)
 
 if __name__ == "__main__":
     unittest.main()
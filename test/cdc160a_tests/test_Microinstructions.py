@@ -90,7 +90,6 @@ class Test(TestCase):
     def _create_temp_file(contents: str) -> str:
         with NamedTemporaryFile("w+", delete=False) as temp_file:
             file_name = temp_file.name
-            print("Temporary file: {0},".format(temp_file.name))
             temp_file.write(contents)
         return file_name
 
@@ -546,7 +545,7 @@ class Test(TestCase):
         Microinstructions.s_indirect_complement_to_a(self.hardware)
         assert self.storage.run_stop_status
         assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654 ^ 0o7777
+        assert self.storage.a_register == (0o7654 ^ 0o7777)
 
     def test_input_to_a_no_device_selected(self) -> None:
         self.storage.a_register = 0o1234
@@ -640,7 +639,7 @@ class Test(TestCase):
         Microinstructions.s_direct_complement_to_a(self.hardware)
         assert self.storage.run_stop_status
         assert self.storage.z_register == 0o7654
-        assert self.storage.a_register == 0o7654 ^ 0o7777
+        assert self.storage.a_register == (0o7654 ^ 0o7777)
 
     def test_s_direct_to_a(self) -> None:
         self.storage.write_direct_bank(READ_AND_WRITE_ADDRESS, 0o7654)
@@ -809,7 +808,7 @@ class Test(TestCase):
         Microinstructions.jump_if_a_nonzero(self.hardware)
         assert self.storage.next_address() == JUMP_ADDRESS
         self.__prepare_for_jump()
-        self.storage.nex = 0o7776
+        self.storage.a_register = 0o7776
         Microinstructions.jump_if_a_nonzero(self.hardware)
         assert self.storage.next_address() == JUMP_ADDRESS
 
@@ -976,7 +975,7 @@ class Test(TestCase):
 
     def test_rotate_a_left_six(self) -> None:
         self.storage.z_register = 0o2143
-        self.storage.z_to_a()
+        self.storage.a_register = 0o2143
         Microinstructions.rotate_a_left_six(self.hardware)
         assert self.storage.z_register == 0o2143
         assert self.storage.a_register == 0o4321
@@ -22,6 +22,7 @@ with the System Source Museum Control Data 160-A Emulator. If not, see
 """
 
 from unittest import TestCase
+import io
 import os
 
 from cdc160a.Device import IOChannelSupport
@@ -37,7 +38,6 @@ class TestPaperTapeReader(TestCase):
     def _create_temp_file(contents: str) -> str:
         with NamedTemporaryFile("w+", delete=False) as temp_file:
             file_name = temp_file.name
-            print("Temporary file: {0},".format(temp_file.name))
             temp_file.write(contents)
         return file_name
 
@@ -113,6 +113,29 @@ class TestPaperTapeReader(TestCase):
         os.unlink(temp_file_name)
         assert not os.path.exists(temp_file_name)
 
+    def test_open_when_already_open(self) -> None:
+        temp_file_name = self._create_temp_file("17\n")
+        assert self.__paper_tape_reader.open_stream(
+            io.StringIO("456\n"), "tape")
+        assert not self.__paper_tape_reader.open(temp_file_name)
+        assert self.__paper_tape_reader.file_name() == "tape"
+        assert self.__paper_tape_reader.read() == (True, 0o456)
+        self.__paper_tape_reader.close()
+        os.unlink(temp_file_name)
+
+    def test_open_stream(self) -> None:
+        stream = io.StringIO("17\n456\n")
+        assert self.__paper_tape_reader.open_stream(stream, "tape")
+        assert self.__paper_tape_reader.is_open()
+        assert self.__paper_tape_reader.file_name() == "tape"
+        assert not self.__paper_tape_reader.open_stream(
+            io.StringIO("0\n"), "other")
+        assert self.__paper_tape_reader.read() == (True, 0o17)
+        assert self.__paper_tape_reader.read() == (True, 0o456)
+        self.__paper_tape_reader.close()
+        assert not self.__paper_tape_reader.is_open()
+        assert stream.closed
+
     def test_read_delay(self) -> None:
         assert self.__paper_tape_reader.read_delay() == 446
 
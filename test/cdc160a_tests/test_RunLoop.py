@@ -378,7 +378,6 @@ class TestRunLoop(TestCase):
 
     def test_exc(self) -> None:
         temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
         temp_file.write("456\n")
         temp_file.close()
 
@@ -396,7 +395,6 @@ class TestRunLoop(TestCase):
 
     def test_exf(self) -> None:
         temp_file = NamedTemporaryFile("w+", delete=False)
-        print("Temporary file: {0},".format(temp_file.name))
         temp_file.write("456\n")
         temp_file.close()
 
@@ -473,6 +473,14 @@ class TestStorage(TestCase):
         self.storage.relative_forward_to_s()
         assert self.storage.s_register == INSTRUCTION_ADDRESS + 0o51
 
+    def test_relative_bank_view(self) -> None:
+        self.storage.relative_storage_bank = 4
+        relative_bank = self.storage.relative_bank_view()
+        assert relative_bank[INSTRUCTION_ADDRESS] == 0x2100
+        relative_bank[READ_AND_WRITE_ADDRESS] = 0o7070
+        assert self.storage.read_absolute(4, READ_AND_WRITE_ADDRESS) == 0o7070
+        assert self.storage.read_absolute(3, READ_AND_WRITE_ADDRESS) == 0o13
+
     def test_request_interrupt(self) -> None:
         assert self.storage.interrupt_requests == [False, False, False, False]
         self.storage.request_interrupt(0o20)
@@ -915,11 +923,6 @@ class TestStorage(TestCase):
         assert self.storage.z_register == 0o14
         assert self.storage.a_register == 0o06
 
-    def test_z_to_a(self) -> None:
-        self.storage.z_register = 0o4321
-        self.storage.z_to_a()
-        assert self.storage.a_register == 0o4321
-
     def test_z_to_next_instruction(self) -> None:
         self.storage.z_register = 0o4321
         self.storage.z_to_next_address()